@@ -24,7 +24,6 @@ Reference: Design document at docs/amor-heartbeat-prediction-design.md
 """
 
 from dataclasses import dataclass
-from collections import deque
 from typing import Optional
 import numpy as np
 from amor.log import get_logger
@@ -45,6 +44,10 @@ OBSERVATION_MIN_INTERVAL_MS = 400  # Minimum time between observations (debounci
 MESSAGE_GAP_THRESHOLD_S = 65.0  # Message gap that triggers WARMUP reset (allows WiFi reconnection: max 60s + 5s safety buffer)
 REBOOT_DETECTION_THRESHOLD_S = 3.0  # Backward jump > this indicates ESP32 reboot
 
+# Middle positions of a full window; the median is the mean of the two
+# (the same element twice for an odd window)
+_MEDIAN_KTH = ((THRESHOLD_WINDOW - 1) // 2, THRESHOLD_WINDOW // 2)
+
 
 @dataclass
 class ThresholdCrossing:
@@ -84,7 +87,9 @@ class ThresholdDetector:
     Attributes:
         ppg_id (int): Sensor ID (0-3)
         state (str): Current state (STATE_WARMUP, STATE_ACTIVE, STATE_PAUSED)
-        samples (deque): Rolling buffer of last THRESHOLD_WINDOW samples
+        samples (np.ndarray): Preallocated window of the last THRESHOLD_WINDOW samples
+            (write order, not time order - median, MAD and saturation don't care)
+        sample_count (int): Number of valid samples in the window (≤ THRESHOLD_WINDOW)
         previous_sample (float): Previous sample for crossing detection
         last_message_timestamp (float): Timestamp of last received sample (seconds)
         last_observation_timestamp_ms (int): Timestamp of last observation (for debouncing)
@@ -111,8 +116,18 @@ class ThresholdDetector:
         if verbose:
             self.logger.setLevel(logging.DEBUG)
 
-        # Sample buffer: only keep THRESHOLD_WINDOW samples for MAD calculation
-        self.samples: deque = deque(maxlen=THRESHOLD_WINDOW)
+        # Sample window: preallocated ring of THRESHOLD_WINDOW samples for MAD
+        # calculation, so NumPy reads it in place instead of copying a deque
+        self.samples: np.ndarray = np.zeros(THRESHOLD_WINDOW, dtype=np.float64)
+        self.sample_count: int = 0
+        self._write_index: int = 0
+
+        # Scratch buffer partitioned in place for the median/MAD selection
+        self._scratch: np.ndarray = np.empty(THRESHOLD_WINDOW, dtype=np.float64)
+
+        # Running counts of window samples at each rail (saturation check)
+        self._bottom_rail_count: int = 0
+        self._top_rail_count: int = 0
 
         # Crossing detection state
         self.previous_sample: Optional[float] = None
@@ -176,10 +191,12 @@ class ThresholdDetector:
 
         # Update timestamp and add sample to buffer
         self.last_message_timestamp = timestamp_s
-        self.samples.append(value)
+        self._append_sample(value)
 
-        # Per-sample debug logging (controlled by logger level)
-        self._log_sample_debug(value, timestamp_ms)
+        # Per-sample debug logging (controlled by logger level); checked here
+        # so the extra MAD pass and string building are skipped when disabled
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log_sample_debug(value, timestamp_ms)
 
         # State machine and crossing detection
         return self._update_state_and_detect(value, timestamp_ms, timestamp_s)
@@ -198,45 +215,48 @@ class ThresholdDetector:
         """
         # State machine handling
         if self.state == self.STATE_WARMUP:
-            if len(self.samples) >= WARMUP_SAMPLES:
+            if self.sample_count >= WARMUP_SAMPLES:
                 self.logger.info(f"PPG {self.ppg_id}: State transition WARMUP → ACTIVE")
                 self.state = self.STATE_ACTIVE
 
         elif self.state == self.STATE_ACTIVE:
-            # Check signal quality - pause if MAD too low or sensor saturated
-            if len(self.samples) >= THRESHOLD_WINDOW:
-                median, mad, _ = self._calculate_mad_threshold()
+            if self.sample_count < THRESHOLD_WINDOW:
+                return None
 
-                if mad < MAD_MIN_QUALITY:
-                    # Signal too flat (noise floor)
-                    self.logger.info(f"PPG {self.ppg_id}: State transition ACTIVE → PAUSED "
-                                    f"(MAD {mad:.1f} < {MAD_MIN_QUALITY})")
-                    self.state = self.STATE_PAUSED
-                    self.noise_start_time = timestamp_s
-                    return None
-                elif MAD_MAX_QUALITY is not None and mad > MAD_MAX_QUALITY:
-                    # Signal too noisy (only if MAD_MAX_QUALITY enabled)
-                    self.logger.info(f"PPG {self.ppg_id}: State transition ACTIVE → PAUSED "
-                                    f"(MAD {mad:.1f} > {MAD_MAX_QUALITY})")
-                    self.state = self.STATE_PAUSED
-                    self.noise_start_time = timestamp_s
-                    return None
+            # Check signal quality - pause if MAD too low or sensor saturated.
+            # The same window statistics feed crossing detection below.
+            median, mad, threshold = self._calculate_mad_threshold()
 
-                # Check for sensor saturation (stuck at one rail)
-                saturation_ratio = self._check_saturation()
-                if saturation_ratio > SATURATION_THRESHOLD:
-                    self.logger.info(f"PPG {self.ppg_id}: State transition ACTIVE → PAUSED "
-                                    f"(saturation {saturation_ratio:.1%} > {SATURATION_THRESHOLD:.1%})")
-                    self.state = self.STATE_PAUSED
-                    self.noise_start_time = timestamp_s
-                    return None
+            if mad < MAD_MIN_QUALITY:
+                # Signal too flat (noise floor)
+                self.logger.info(f"PPG {self.ppg_id}: State transition ACTIVE → PAUSED "
+                                f"(MAD {mad:.1f} < {MAD_MIN_QUALITY})")
+                self.state = self.STATE_PAUSED
+                self.noise_start_time = timestamp_s
+                return None
+            elif MAD_MAX_QUALITY is not None and mad > MAD_MAX_QUALITY:
+                # Signal too noisy (only if MAD_MAX_QUALITY enabled)
+                self.logger.info(f"PPG {self.ppg_id}: State transition ACTIVE → PAUSED "
+                                f"(MAD {mad:.1f} > {MAD_MAX_QUALITY})")
+                self.state = self.STATE_PAUSED
+                self.noise_start_time = timestamp_s
+                return None
+
+            # Check for sensor saturation (stuck at one rail)
+            saturation_ratio = self._check_saturation()
+            if saturation_ratio > SATURATION_THRESHOLD:
+                self.logger.info(f"PPG {self.ppg_id}: State transition ACTIVE → PAUSED "
+                                f"(saturation {saturation_ratio:.1%} > {SATURATION_THRESHOLD:.1%})")
+                self.state = self.STATE_PAUSED
+                self.noise_start_time = timestamp_s
+                return None
 
             # Detect crossing in ACTIVE state
-            return self._detect_crossing(value, timestamp_ms)
+            return self._detect_crossing(value, timestamp_ms, median, mad, threshold)
 
         elif self.state == self.STATE_PAUSED:
             # Check for resume condition - MAD must be valid and sensor not saturated
-            if len(self.samples) >= THRESHOLD_WINDOW:
+            if self.sample_count >= THRESHOLD_WINDOW:
                 median, mad, _ = self._calculate_mad_threshold()
                 saturation_ratio = self._check_saturation()
 
@@ -264,7 +284,8 @@ class ThresholdDetector:
 
         return None
 
-    def _detect_crossing(self, value: int, timestamp_ms: int) -> Optional[ThresholdCrossing]:
+    def _detect_crossing(self, value: int, timestamp_ms: int, median: float,
+                         mad: float, threshold: float) -> Optional[ThresholdCrossing]:
         """Detect upward threshold crossing.
 
         Uses MAD-based threshold with upward crossing detection:
@@ -275,24 +296,21 @@ class ThresholdDetector:
         Args:
             value: Current sample value
             timestamp_ms: Timestamp in milliseconds
+            median: Window median from _calculate_mad_threshold()
+            mad: Window MAD from _calculate_mad_threshold()
+            threshold: MAD-based threshold from _calculate_mad_threshold()
 
         Returns:
             ThresholdCrossing if upward crossing detected and debouncing passed, None otherwise
         """
-        if len(self.samples) < THRESHOLD_WINDOW:
-            return None
-
-        # Calculate MAD-based threshold
-        median, mad, threshold = self._calculate_mad_threshold()
-
         # Check for upward crossing
         crossing_detected = False
         if self.previous_sample is not None:
             if self.previous_sample < threshold and value >= threshold:
                 crossing_detected = True
-                self.logger.info(f"PPG {self.ppg_id}: Threshold crossing detected - "
-                                f"sample={value:.0f}, threshold={threshold:.0f}, "
-                                f"median={median:.0f}, MAD={mad:.1f}")
+                self.logger.debug("PPG %d: Threshold crossing detected - "
+                                  "sample=%.0f, threshold=%.0f, median=%.0f, MAD=%.1f",
+                                  self.ppg_id, value, threshold, median, mad)
 
         self.previous_sample = value
 
@@ -303,8 +321,9 @@ class ThresholdDetector:
         if self.last_observation_timestamp_ms is not None:
             time_since_last = timestamp_ms - self.last_observation_timestamp_ms
             if time_since_last < OBSERVATION_MIN_INTERVAL_MS:
-                self.logger.info(f"PPG {self.ppg_id}: Crossing debounced - "
-                                f"only {time_since_last:.0f}ms since last observation")
+                self.logger.debug("PPG %d: Crossing debounced - "
+                                  "only %.0fms since last observation",
+                                  self.ppg_id, time_since_last)
                 return None
 
         # Record observation
@@ -322,7 +341,8 @@ class ThresholdDetector:
         """Log per-sample debug information.
 
         Shows sample value, state, MAD, threshold, and detection status.
-        Called only when verbose=True.
+        Called only when the logger has DEBUG enabled (verbose=True or
+        AMOR_LOG_LEVEL=DEBUG).
 
         Args:
             value: Current sample value
@@ -332,7 +352,7 @@ class ThresholdDetector:
         state_str = self.state.upper()
 
         # Calculate MAD/threshold if we have enough samples
-        if len(self.samples) >= THRESHOLD_WINDOW:
+        if self.sample_count >= THRESHOLD_WINDOW:
             median, mad, threshold = self._calculate_mad_threshold()
 
             # Check if this sample would cross threshold
@@ -361,7 +381,7 @@ class ThresholdDetector:
                              f"state={state_str:6s} {crossing}{quality}")
         else:
             # Not enough samples yet
-            samples_needed = THRESHOLD_WINDOW - len(self.samples)
+            samples_needed = THRESHOLD_WINDOW - self.sample_count
             self.logger.debug(f"PPG {self.ppg_id}: sample={value:4d},state={state_str:6s} "
                              f"(need {samples_needed} more samples for MAD)")
 
@@ -377,13 +397,47 @@ class ThresholdDetector:
                 mad: Median Absolute Deviation
                 threshold: median + MAD_THRESHOLD_K * mad
         """
-        # samples deque has maxlen=THRESHOLD_WINDOW, so no need to slice
-        sample_array = np.array(list(self.samples))
-        median = np.median(sample_array)
-        mad = np.median(np.abs(sample_array - median))
+        # Only called with a full window, so the whole buffer is the window.
+        # Both medians are O(n) selections into the scratch buffer; this gives
+        # the same values as np.median without its sort/NaN-handling overhead.
+        lo, hi = _MEDIAN_KTH
+        scratch = self._scratch
+        scratch[:] = self.samples
+        scratch.partition(_MEDIAN_KTH)
+        median = (scratch[lo] + scratch[hi]) * 0.5
+
+        np.subtract(self.samples, median, out=scratch)
+        np.abs(scratch, out=scratch)
+        scratch.partition(_MEDIAN_KTH)
+        mad = (scratch[lo] + scratch[hi]) * 0.5
         threshold = median + MAD_THRESHOLD_K * mad
         return median, mad, threshold
 
+    def _append_sample(self, value: int) -> None:
+        """Write a sample into the window, keeping rail counts in step.
+
+        Args:
+            value: PPG ADC sample (0-4095)
+        """
+        index = self._write_index
+        if self.sample_count < THRESHOLD_WINDOW:
+            self.sample_count += 1
+        else:
+            # Evict the oldest sample, which lives in the slot being overwritten
+            evicted = self.samples[index]
+            if evicted <= SATURATION_BOTTOM_RAIL:
+                self._bottom_rail_count -= 1
+            elif evicted >= SATURATION_TOP_RAIL:
+                self._top_rail_count -= 1
+
+        if value <= SATURATION_BOTTOM_RAIL:
+            self._bottom_rail_count += 1
+        elif value >= SATURATION_TOP_RAIL:
+            self._top_rail_count += 1
+
+        self.samples[index] = value
+        self._write_index = index + 1 if index + 1 < THRESHOLD_WINDOW else 0
+
     def _check_saturation(self) -> float:
         """Check if sensor is saturated (stuck at one rail).
 
@@ -401,18 +455,12 @@ class ThresholdDetector:
             - 40% at 4095, 40% at 0, 20% middle: returns 0.4 (max of the two)
             - Evenly distributed: returns ~0.0
         """
-        if len(self.samples) < THRESHOLD_WINDOW:
+        if self.sample_count < THRESHOLD_WINDOW:
             return 0.0
 
-        sample_array = np.array(list(self.samples))
-
-        # Count samples stuck at each rail
-        bottom_saturated = np.sum(sample_array <= SATURATION_BOTTOM_RAIL)
-        top_saturated = np.sum(sample_array >= SATURATION_TOP_RAIL)
-
-        # Return the worse of the two (stuck at one rail)
-        bottom_ratio = bottom_saturated / len(self.samples)
-        top_ratio = top_saturated / len(self.samples)
+        # Rail counts are maintained as samples enter and leave the window
+        bottom_ratio = self._bottom_rail_count / THRESHOLD_WINDOW
+        top_ratio = self._top_rail_count / THRESHOLD_WINDOW
 
         return max(bottom_ratio, top_ratio)
 
@@ -424,7 +472,10 @@ class ThresholdDetector:
         Sets reset flag so processor can coordinate its beat state.
         """
         self.state = self.STATE_WARMUP
-        self.samples.clear()
+        self.sample_count = 0
+        self._write_index = 0
+        self._bottom_rail_count = 0
+        self._top_rail_count = 0
         self.previous_sample = None
         self.last_observation_timestamp_ms = None
         self.noise_start_time = None
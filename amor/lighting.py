@@ -57,13 +57,14 @@ import sys
 import threading
 import time
 from pathlib import Path
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
 import yaml
 from pythonosc import dispatcher, udp_client
 from kasa import Discover
 from kasa.iot import IotBulb
 
 from amor import osc
+from amor.lighting_errors import BulbUpdateError
 from amor.lighting_programs import PROGRAMS, LightingProgram
 from amor.log import get_logger
 
@@ -165,17 +166,8 @@ class KasaBackend:
                     zone_cfg = zones_config.get(zone, {})
                     hue = zone_cfg.get('hue', 120)
 
-                    # Get bulb (already updated in phase 1)
-                    bulb = self.bulbs.get(bulb_id)
-                    if not bulb:
-                        raise ValueError(f"Unknown bulb ID: {bulb_id}")
-
-                    light = bulb.modules.get("Light")
-                    if not light:
-                        raise RuntimeError(f"Bulb {bulb_id} has no Light module")
-
-                    # Set to baseline
-                    await light.set_hsv(hue, baseline_sat, baseline_bri, transition=0)
+                    # Set to baseline (bulb already updated in phase 1)
+                    await self._set_hsv(bulb_id, hue, baseline_sat, baseline_bri, 0)
 
                     # Get bulb name from config for logging
                     bulb_cfg = next(
@@ -197,6 +189,25 @@ class KasaBackend:
             logger.error(f"Kasa initialization failed: {e}")
             raise SystemExit(1)
 
+    async def _set_hsv(self, bulb_id: str, hue: int, saturation: int, brightness: int,
+                       transition: int) -> None:
+        """Look up a bulb and set its HSV via the Light module.
+
+        Must run on self.loop, where the device objects live.
+
+        Raises:
+            ValueError: If bulb_id is not a connected bulb
+            RuntimeError: If the bulb has no Light module
+        """
+        bulb = self.bulbs.get(bulb_id)
+        if not bulb:
+            raise ValueError(f"Unknown bulb ID: {bulb_id}")
+        # python-kasa 0.6+ Light module API (capitalized)
+        light = bulb.modules.get("Light")
+        if not light:
+            raise RuntimeError(f"Bulb {bulb_id} has no Light module")
+        await light.set_hsv(hue, saturation, brightness, transition=transition)
+
     def set_color(self, bulb_id: str, hue: int, saturation: int, brightness: int, transition: int = 0) -> None:
         """Set Kasa bulb to HSV values with optional smooth transition.
 
@@ -209,25 +220,53 @@ class KasaBackend:
                        Smooth transitions require >= 2000ms for Kasa hardware.
         """
         try:
-            bulb = self.bulbs.get(bulb_id)
-            if not bulb:
-                raise ValueError(f"Unknown bulb ID: {bulb_id}")
-
             # python-kasa 0.6+ uses async, wrap in sync call
-            # Use Light module API (capitalized)
-            async def set_color_async():
-                light = bulb.modules.get("Light")
-                if not light:
-                    raise RuntimeError(f"Bulb {bulb_id} has no Light module")
-                await light.set_hsv(hue, saturation, brightness, transition=transition)
-
             # Run in persistent event loop to keep device objects valid
-            future = asyncio.run_coroutine_threadsafe(set_color_async(), self.loop)
+            future = asyncio.run_coroutine_threadsafe(
+                self._set_hsv(bulb_id, hue, saturation, brightness, transition), self.loop)
             future.result()  # Block until complete
 
         except Exception as e:
             raise RuntimeError(f"Failed to set color for {bulb_id}: {e}")
 
+    def set_colors(self, updates: List[Tuple[str, int, int, int, int]]) -> None:
+        """Set several bulbs at once, sending all commands concurrently.
+
+        Equivalent to calling set_color() for each update, but the commands
+        are gathered in a single event loop pass so N bulbs cost roughly one
+        round trip instead of N sequential ones.
+
+        Args:
+            updates: List of (bulb_id, hue, saturation, brightness, transition)
+                     tuples, same units as set_color()
+
+        Raises:
+            BulbUpdateError: If any bulb update failed (all updates are attempted;
+                failed_bulbs lists the ones that did not take)
+        """
+        if not updates:
+            return
+
+        async def set_colors_async():
+            return await asyncio.gather(
+                *(self._set_hsv(*update) for update in updates),
+                return_exceptions=True
+            )
+
+        # Run in persistent event loop to keep device objects valid
+        future = asyncio.run_coroutine_threadsafe(set_colors_async(), self.loop)
+        results = future.result()  # Block until all complete
+
+        failures = [
+            (update[0], result)
+            for update, result in zip(updates, results)
+            if isinstance(result, Exception)
+        ]
+        if failures:
+            details = ', '.join(f"{bulb_id}: {error}" for bulb_id, error in failures)
+            raise BulbUpdateError(f"Failed to set color for {details}",
+                                  [bulb_id for bulb_id, _ in failures])
+
     def set_color_delayed(self, bulb_id: str, hue: int, saturation: int, brightness: int,
                           delay_ms: int, transition: int = 0) -> None:
         """Schedule set_color command after delay using asyncio (non-blocking).
@@ -242,13 +281,7 @@ class KasaBackend:
         """
         async def delayed_set_color():
             await asyncio.sleep(delay_ms / 1000.0)
-            bulb = self.bulbs.get(bulb_id)
-            if not bulb:
-                raise ValueError(f"Unknown bulb ID: {bulb_id}")
-            light = bulb.modules.get("Light")
-            if not light:
-                raise RuntimeError(f"Bulb {bulb_id} has no Light module")
-            await light.set_hsv(hue, saturation, brightness, transition=transition)
+            await self._set_hsv(bulb_id, hue, saturation, brightness, transition)
 
         # Schedule in persistent event loop (non-blocking)
         asyncio.run_coroutine_threadsafe(delayed_set_color(), self.loop)
@@ -311,17 +344,8 @@ class KasaBackend:
                     zone_cfg = zones_config.get(zone, {})
                     hue = zone_cfg.get('hue', 120)  # Default green if not specified
 
-                    # Get bulb
-                    bulb = self.bulbs.get(bulb_id)
-                    if not bulb:
-                        raise ValueError(f"Unknown bulb ID: {bulb_id}")
-
-                    light = bulb.modules.get("Light")
-                    if not light:
-                        raise RuntimeError(f"Bulb {bulb_id} has no Light module")
-
                     # Set to baseline
-                    await light.set_hsv(hue, baseline_sat, baseline_bri, transition=0)
+                    await self._set_hsv(bulb_id, hue, baseline_sat, baseline_bri, 0)
 
                     # Get bulb name from config for logging
                     bulb_cfg = next(
@@ -809,8 +833,8 @@ class LightingEngine:
         self.tick_thread.start()
 
         # Send ready signal to sequencer for state restoration (broadcast)
-        ready_client = osc.BroadcastUDPClient("255.255.255.255", osc.PORT_CONTROL)
-        ready_client.send_message("/status/ready/lighting", [])
+        with osc.BroadcastUDPClient("255.255.255.255", osc.PORT_CONTROL) as ready_client:
+            ready_client.send_message("/status/ready/lighting", [])
         logger.info("Sent ready signal to sequencer")
 
         logger.info(f"Lighting Engine listening on ports {self.port} (beats) and {osc.PORT_CONTROL} (control)")
@@ -0,0 +1,22 @@
+"""
+Lighting Errors - Exceptions shared by the lighting backend and programs
+
+Lives in its own module so both amor.lighting (which raises them) and
+amor.lighting_programs (which handles them) can import them; lighting.py
+already imports lighting_programs, so neither can import the other.
+"""
+
+from typing import List
+
+
+class BulbUpdateError(RuntimeError):
+    """Raised by KasaBackend.set_colors() when some bulb updates failed.
+
+    Attributes:
+        failed_bulbs (list): IDs of the bulbs whose update failed; the
+            other bulbs in the batch were updated
+    """
+
+    def __init__(self, message: str, failed_bulbs: List[str]):
+        super().__init__(message)
+        self.failed_bulbs = failed_bulbs
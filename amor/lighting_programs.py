@@ -29,10 +29,12 @@ Programs receive config from lighting.yaml's 'program.config' section.
 Global config (zones, effects, kasa) available via engine's self.config.
 """
 
-from typing import Dict, Any, Optional
-import math
+from typing import Dict, Any, Optional, Tuple
+from math import ceil, copysign, inf, pi, sin
+import threading
 import time
 
+from amor.lighting_errors import BulbUpdateError
 from amor.log import get_logger
 
 logger = get_logger(__name__)
@@ -42,6 +44,53 @@ from amor.log import get_logger
 logger = get_logger(__name__)
 
 
+# BPM → hue lookup for the BPM-reactive programs, one entry per whole BPM
+# (40 BPM=blue/240°, 120 BPM=red/0°). Index with clamped int(bpm) - 40.
+_BPM_HUE_MIN = 40
+_BPM_HUE_MAX = 120
+_BPM_HUE_LUT = tuple((_BPM_HUE_MAX - b) * 3 for b in range(_BPM_HUE_MIN, _BPM_HUE_MAX + 1))
+
+
+def _fade_duration(bpm: float) -> Tuple[int, int]:
+    """BPM-adaptive fade: smallest whole number of beats lasting >= 2000ms.
+
+    2000ms is the Kasa hardware minimum for a smooth transition. Since
+    2000 / IBI == bpm / 30, the beat count needs no intermediate division.
+
+    Args:
+        bpm (float): Heart rate in beats per minute (must be > 0)
+
+    Returns:
+        Tuple of (fade_beats, fade_ms)
+    """
+    fade_beats = ceil(bpm / 30.0)
+    return fade_beats, int(fade_beats * 60000.0 / bpm)
+
+
+class FadeZoneState:
+    """Per-zone fade state machine for the slow pulse programs.
+
+    Slotted so the 4-zone tick loop reads attributes at fixed offsets
+    instead of hashing dict keys.
+
+    Attributes:
+        phase (str): at_baseline | fade_in_active | at_peak_waiting | fade_out_active
+        transition_start_ms (int): Monotonic ms when the active fade began
+        fade_duration_ms (int): Duration of the active fade
+        hue (int): Last hue sent (BPM-reactive programs only)
+        saturation (int): Last saturation sent (BPM-reactive programs only)
+    """
+
+    __slots__ = ('phase', 'transition_start_ms', 'fade_duration_ms', 'hue', 'saturation')
+
+    def __init__(self):
+        self.phase = 'at_baseline'
+        self.transition_start_ms = 0
+        self.fade_duration_ms = 2000
+        self.hue = 200  # Default calm blue
+        self.saturation = 75  # Default saturation
+
+
 class LightingProgram:
     """Base class for stateful lighting programs controlling all zones.
 
@@ -153,7 +202,8 @@ class SoftPulseProgram(LightingProgram):
     Each zone has a fixed hue (defined in config), and the bulb pulses
     brightness from baseline to peak and back on each heartbeat.
 
-    This program is stateless and only responds to beats (no tick updates).
+    This program only responds to beats (no tick updates); its state holds
+    nothing but cached config values.
     Maintains backward compatibility with original lighting.py behavior.
 
     Configuration:
@@ -165,7 +215,10 @@ class SoftPulseProgram(LightingProgram):
         """Initialize soft pulse program (no state needed)."""
         # Set all bulbs to baseline on program start
         backend.set_all_baseline()
-        return {}
+        effects = config.get('effects') or {}
+        return {
+            'saturation': effects.get('baseline_saturation', 75),
+        }
 
     def on_beat(self, state: dict, ppg_id: int, timestamp_ms: int, bpm: float,
                 intensity: float, backend: 'KasaBackend') -> None:
@@ -175,7 +228,7 @@ class SoftPulseProgram(LightingProgram):
         brightness from baseline to peak and back on each heartbeat.
 
         Args:
-            state (dict): Program state (unused, stateless program)
+            state (dict): Program state (cached effects config)
             ppg_id (int): PPG sensor ID (0-3), maps to zone
             timestamp_ms (int): Unix time (milliseconds) when beat detected
             bpm (float): Heart rate in beats per minute (unused in this program)
@@ -191,13 +244,13 @@ class SoftPulseProgram(LightingProgram):
         # Get fixed hue and saturation for this zone
         zone_cfg = backend.config['zones'][ppg_id]
         hue = zone_cfg['hue']
-        saturation = backend.config['effects'].get('baseline_saturation', 75)
+        saturation = state['saturation']
 
         # Execute pulse
         backend.pulse(bulb_id, hue, saturation)
 
         zone_name = zone_cfg.get('name', f'Zone {ppg_id}')
-        logger.info(f"PULSE: {zone_name} (PPG {ppg_id}), BPM: {bpm:.1f}, Hue: {hue}°")
+        logger.info("PULSE: %s (PPG %d), BPM: %.1f, Hue: %s°", zone_name, ppg_id, bpm, hue)
 
     def on_cleanup(self, state: dict, backend: 'KasaBackend') -> None:
         """Cleanup: bulbs remain in current state."""
@@ -220,11 +273,14 @@ class RotatingGradientProgram(LightingProgram):
     def on_init(self, config: dict, backend: 'KasaBackend') -> dict:
         """Initialize rotating gradient with configurable speed."""
         speed = config.get('program', {}).get('config', {}).get('rotation_speed', 30.0)
+        effects = config.get('effects') or {}
         return {
             'offset': 0.0,  # Current gradient rotation offset (0-360)
             'rotation_speed': speed,  # Degrees per second
             'zone_spacing': 90,  # 90° between adjacent zones
             'time_since_update': 0.0,  # Time accumulator for 2s throttle
+            'baseline_bri': effects.get('baseline_brightness', 40),
+            'pulse_max': effects.get('pulse_max', 70),
         }
 
     def on_tick(self, state: dict, dt: float, backend: 'KasaBackend') -> None:
@@ -241,13 +297,15 @@ class RotatingGradientProgram(LightingProgram):
 
         state['time_since_update'] = 0.0
 
-        # Update all zone colors with smooth 2s transitions
-        baseline_bri = backend.config.get('effects', {}).get('baseline_brightness', 40)
+        # Update all zone colors with smooth 2s transitions (one batched send)
+        baseline_bri = state['baseline_bri']
+        updates = []
         for zone in range(4):
             bulb_id = backend.get_bulb_for_zone(zone)
             if bulb_id:
                 hue = int((zone * state['zone_spacing'] + state['offset']) % 360)
-                backend.set_color(bulb_id, hue, 75, baseline_bri, transition=2000)
+                updates.append((bulb_id, hue, 75, baseline_bri, 2000))
+        backend.set_colors(updates)
 
     def on_beat(self, state: dict, ppg_id: int, timestamp_ms: int, bpm: float,
                 intensity: float, backend: 'KasaBackend') -> None:
@@ -263,12 +321,10 @@ class RotatingGradientProgram(LightingProgram):
         hue = int((ppg_id * state['zone_spacing'] + state['offset']) % 360)
 
         # Fast attack smooth fade (same as FastAttackProgram)
-        baseline_bri = backend.config['effects'].get('baseline_brightness', 40)
-        pulse_max = backend.config['effects'].get('pulse_max', 70)
+        baseline_bri = state['baseline_bri']
+        pulse_max = state['pulse_max']
 
-        ibi_ms = 60000.0 / bpm
-        fade_beats = math.ceil(2000.0 / ibi_ms)
-        fade_ms = int(fade_beats * ibi_ms)
+        fade_beats, fade_ms = _fade_duration(bpm)
 
         # Instant attack, smooth fade
         backend.set_color(bulb_id, hue, 75, pulse_max, transition=0)
@@ -333,14 +389,16 @@ class BreathingSyncProgram(LightingProgram):
         brightness_range = state['max_brightness'] - state['min_brightness']
         target_brightness = int(
             state['min_brightness'] +
-            brightness_range * (0.5 + 0.5 * math.sin(future_phase * 2 * math.pi))
+            brightness_range * (0.5 + 0.5 * sin(future_phase * 2 * pi))
         )
 
-        # Apply to all zones with smooth 2s transition
+        # Apply to all zones with smooth 2s transition (one batched send)
+        updates = []
         for zone in range(4):
             bulb_id = backend.get_bulb_for_zone(zone)
             if bulb_id:
-                backend.set_color(bulb_id, state['base_hue'], 75, target_brightness, transition=2000)
+                updates.append((bulb_id, state['base_hue'], 75, target_brightness, 2000))
+        backend.set_colors(updates)
 
     def on_cleanup(self, state: dict, backend: 'KasaBackend') -> None:
         """Cleanup: bulbs remain in current state."""
@@ -366,6 +424,7 @@ class ConvergenceProgram(LightingProgram):
     def on_init(self, config: dict, backend: 'KasaBackend') -> dict:
         """Initialize convergence detection."""
         prog_config = config.get('program', {}).get('config', {})
+        effects = config.get('effects') or {}
         # Get default hues from zone config
         default_hues = {
             zone: backend.config['zones'][zone]['hue']
@@ -378,6 +437,8 @@ class ConvergenceProgram(LightingProgram):
             'convergence_threshold': prog_config.get('convergence_threshold', 0.05),
             'convergence_hue': prog_config.get('convergence_hue', 45),  # Gold
             'convergence_saturation': prog_config.get('convergence_saturation', 90),
+            'baseline_bri': effects.get('baseline_brightness', 40),
+            'pulse_max': effects.get('pulse_max', 70),
         }
 
     def on_beat(self, state: dict, ppg_id: int, timestamp_ms: int, bpm: float,
@@ -412,13 +473,11 @@ class ConvergenceProgram(LightingProgram):
 
         hue = int(state['zone_hues'][ppg_id])
         saturation = state['convergence_saturation'] if ppg_id in converged_zones else 75
-        baseline_bri = backend.config['effects'].get('baseline_brightness', 40)
-        pulse_max = backend.config['effects'].get('pulse_max', 70)
+        baseline_bri = state['baseline_bri']
+        pulse_max = state['pulse_max']
 
         # Calculate BPM-adaptive fade
-        ibi_ms = 60000.0 / bpm
-        fade_beats = math.ceil(2000.0 / ibi_ms)
-        fade_ms = int(fade_beats * ibi_ms)
+        fade_beats, fade_ms = _fade_duration(bpm)
 
         # Instant attack, smooth fade
         backend.set_color(bulb_id, hue, saturation, pulse_max, transition=0)
@@ -426,8 +485,6 @@ class ConvergenceProgram(LightingProgram):
 
     def on_tick(self, state: dict, dt: float, backend: 'KasaBackend') -> None:
         """Gradually drift non-converged zones back to defaults."""
-        # Update baseline colors for all zones
-        baseline_bri = backend.config.get('effects', {}).get('baseline_brightness', 40)
         for zone in range(4):
             bulb_id = backend.get_bulb_for_zone(zone)
             if bulb_id:
@@ -443,7 +500,7 @@ class ConvergenceProgram(LightingProgram):
                     if abs(diff) < drift_rate:
                         new_hue = default_hue  # Close enough, snap to target
                     else:
-                        new_hue = (current_hue + math.copysign(drift_rate, diff)) % 360
+                        new_hue = (current_hue + copysign(drift_rate, diff)) % 360
                     state['zone_hues'][zone] = new_hue
 
     def on_cleanup(self, state: dict, backend: 'KasaBackend') -> None:
@@ -467,9 +524,13 @@ class WaveChaseProgram(LightingProgram):
     def on_init(self, config: dict, backend: 'KasaBackend') -> dict:
         """Initialize wave chase."""
         prog_config = config.get('program', {}).get('config', {})
+        effects = config.get('effects') or {}
         backend.set_all_baseline()
         return {
             'stagger_ms': prog_config.get('stagger_ms', 500),  # 500ms between zones
+            'baseline_bri': effects.get('baseline_brightness', 40),
+            'pulse_max': effects.get('pulse_max', 70),
+            'saturation': effects.get('baseline_saturation', 75),
         }
 
     def on_beat(self, state: dict, ppg_id: int, timestamp_ms: int, bpm: float,
@@ -479,15 +540,13 @@ class WaveChaseProgram(LightingProgram):
             return
 
         # Get config values
-        baseline_bri = backend.config['effects'].get('baseline_brightness', 40)
-        pulse_max = backend.config['effects'].get('pulse_max', 70)
-        saturation = backend.config['effects'].get('baseline_saturation', 75)
+        baseline_bri = state['baseline_bri']
+        pulse_max = state['pulse_max']
+        saturation = state['saturation']
         stagger_ms = state['stagger_ms']
 
         # Calculate fade duration
-        ibi_ms = 60000.0 / bpm
-        fade_beats = math.ceil(2000.0 / ibi_ms)
-        fade_ms = int(fade_beats * ibi_ms)
+        fade_beats, fade_ms = _fade_duration(bpm)
 
         # Trigger cascade through 4 zones in circular order
         for offset in range(4):
@@ -506,7 +565,6 @@ class WaveChaseProgram(LightingProgram):
                 backend.set_color(bulb_id, hue, saturation, baseline_bri, transition=fade_ms)
             else:
                 # Delayed zones: use thread to wait then pulse
-                import threading
                 def delayed_pulse(bulb, h, s, delay):
                     time.sleep(delay / 1000.0)
                     backend.set_color(bulb, h, s, pulse_max, transition=0)
@@ -541,12 +599,19 @@ class IntensityReactiveProgram(LightingProgram):
     def on_init(self, config: dict, backend: 'KasaBackend') -> dict:
         """Initialize intensity tracking."""
         prog_config = config.get('program', {}).get('config', {})
+        effects = config.get('effects') or {}
+        min_saturation = prog_config.get('min_saturation', 50)
+        max_saturation = prog_config.get('max_saturation', 100)
         return {
             'zone_intensities': {0: 0.5, 1: 0.5, 2: 0.5, 3: 0.5},
             'zone_hues': {0: 0, 1: 0, 2: 0, 3: 0},  # Store current hue per zone
-            'min_saturation': prog_config.get('min_saturation', 50),
-            'max_saturation': prog_config.get('max_saturation', 100),
+            'last_sent': {0: None, 1: None, 2: None, 3: None},  # Last (hue, sat, bri) sent per zone
+            'min_saturation': min_saturation,
+            'max_saturation': max_saturation,
+            'saturation_range': max_saturation - min_saturation,
             'time_since_update': 0.0,  # Time accumulator for 2s throttle
+            'baseline_bri': effects.get('baseline_brightness', 40),
+            'pulse_max': effects.get('pulse_max', 70),
         }
 
     def on_beat(self, state: dict, ppg_id: int, timestamp_ms: int, bpm: float,
@@ -559,40 +624,43 @@ class IntensityReactiveProgram(LightingProgram):
         state['zone_intensities'][ppg_id] = intensity
 
         # BPM to hue mapping (40 BPM=blue/240°, 120 BPM=red/0°)
-        bpm_clamped = min(max(bpm, 40), 120)
-        hue = int((120 - bpm_clamped) * 3)
+        hue = _BPM_HUE_LUT[min(max(int(bpm), _BPM_HUE_MIN), _BPM_HUE_MAX) - _BPM_HUE_MIN]
         state['zone_hues'][ppg_id] = hue
 
         # Intensity to saturation mapping
-        saturation_range = state['max_saturation'] - state['min_saturation']
-        saturation = int(state['min_saturation'] + intensity * saturation_range)
+        saturation = int(state['min_saturation'] + intensity * state['saturation_range'])
 
         bulb_id = backend.get_bulb_for_zone(ppg_id)
         if not bulb_id:
             return
 
         # Fast attack smooth fade
-        baseline_bri = backend.config['effects'].get('baseline_brightness', 40)
-        pulse_max = backend.config['effects'].get('pulse_max', 70)
+        baseline_bri = state['baseline_bri']
+        pulse_max = state['pulse_max']
 
-        ibi_ms = 60000.0 / bpm
-        fade_beats = math.ceil(2000.0 / ibi_ms)
-        fade_ms = int(fade_beats * ibi_ms)
+        fade_beats, fade_ms = _fade_duration(bpm)
 
-        # Instant attack, smooth fade
+        # Instant attack, smooth fade. Forget the cached color first: if the
+        # fade fails after the attack, the bulb is left at pulse_max and the
+        # next on_tick must resend even if its key matches the old entry.
+        state['last_sent'][ppg_id] = None
         backend.set_color(bulb_id, hue, saturation, pulse_max, transition=0)
         backend.set_color(bulb_id, hue, saturation, baseline_bri, transition=fade_ms)
+        state['last_sent'][ppg_id] = (hue, saturation, baseline_bri)
 
         zone_name = backend.config['zones'][ppg_id].get('name', f'Zone {ppg_id}')
-        logger.info(f"PULSE: {zone_name} (PPG {ppg_id}), BPM: {bpm:.1f}, "
-                    f"Intensity: {intensity:.2f}, Hue: {hue}°, Sat: {saturation}%")
+        logger.info("PULSE: %s (PPG %d), BPM: %.1f, Intensity: %.2f, Hue: %d°, Sat: %d%%",
+                    zone_name, ppg_id, bpm, intensity, hue, saturation)
 
     def on_tick(self, state: dict, dt: float, backend: 'KasaBackend') -> None:
         """Update bulbs to show decaying intensity with 2s smooth transitions."""
         # Always update intensity decay (internal state)
+        # Decay factor depends only on dt, so compute it once per tick
+        decay = 0.95 ** (dt * 10)
+        intensities = state['zone_intensities']
         for zone in range(4):
             # Exponential decay with floor
-            state['zone_intensities'][zone] = max(0.1, state['zone_intensities'][zone] * (0.95 ** (dt * 10)))
+            intensities[zone] = max(0.1, intensities[zone] * decay)
 
         # Accumulate time for throttling
         state['time_since_update'] += dt
@@ -603,17 +671,38 @@ class IntensityReactiveProgram(LightingProgram):
 
         state['time_since_update'] = 0.0
 
-        # Update all zones with smooth 2s transitions
-        baseline_bri = backend.config.get('effects', {}).get('baseline_brightness', 40)
+        # Update all zones with smooth 2s transitions (one batched send)
+        baseline_bri = state['baseline_bri']
+        min_sat = state['min_saturation']
+        sat_range = state['saturation_range']
+        last_sent = state['last_sent']
+        updates = []
+        pending = []  # (zone, bulb_id, key) for each update, cached once sent
         for zone in range(4):
             bulb_id = backend.get_bulb_for_zone(zone)
             if bulb_id:
                 # Recompute saturation based on current intensity
-                sat_range = state['max_saturation'] - state['min_saturation']
-                saturation = int(state['min_saturation'] + state['zone_intensities'][zone] * sat_range)
+                saturation = int(min_sat + intensities[zone] * sat_range)
                 # Use stored hue from last beat
                 hue = state['zone_hues'][zone]
-                backend.set_color(bulb_id, hue, saturation, baseline_bri, transition=2000)
+                # Skip the network call if the bulb already has this color
+                key = (hue, saturation, baseline_bri)
+                if last_sent[zone] == key:
+                    continue
+                updates.append((bulb_id, hue, saturation, baseline_bri, 2000))
+                pending.append((zone, bulb_id, key))
+
+        try:
+            backend.set_colors(updates)
+        except BulbUpdateError as e:
+            # Cache only the bulbs that took the color; failed zones are reset
+            # so the next update resends them even if the color is unchanged
+            for zone, bulb_id, key in pending:
+                last_sent[zone] = None if bulb_id in e.failed_bulbs else key
+            raise
+
+        for zone, _, key in pending:
+            last_sent[zone] = key
 
     def on_cleanup(self, state: dict, backend: 'KasaBackend') -> None:
         """Cleanup: bulbs remain in current state."""
@@ -642,9 +731,15 @@ class FastAttackProgram(LightingProgram):
     def on_init(self, config: dict, backend: 'KasaBackend') -> dict:
         """Initialize fast attack program with per-zone cycle tracking."""
         backend.set_all_baseline()
+        effects = config.get('effects') or {}
         return {
             'zone_cycle_end': {0: 0, 1: 0, 2: 0, 3: 0},      # timestamp_ms when cycle ends
             'beats_discarded': {0: 0, 1: 0, 2: 0, 3: 0},    # counter for statistics
+            'saturation': effects.get('baseline_saturation', 75),
+            'baseline_bri': effects.get('baseline_brightness', 40),
+            'pulse_max': effects.get('pulse_max', 70),
+            'attack_time_ms': effects.get('attack_time_ms', 200),
+            'sustain_time_ms': effects.get('sustain_time_ms', 100),
         }
 
     def on_beat(self, state: dict, ppg_id: int, timestamp_ms: int, bpm: float,
@@ -663,7 +758,7 @@ class FastAttackProgram(LightingProgram):
         if timestamp_ms < state['zone_cycle_end'][ppg_id]:
             state['beats_discarded'][ppg_id] += 1
             time_until_end = state['zone_cycle_end'][ppg_id] - timestamp_ms
-            logger.debug(f"Zone {ppg_id} busy for {time_until_end}ms, discarding beat")
+            logger.debug("Zone %d busy for %dms, discarding beat", ppg_id, time_until_end)
             return
 
         bulb_id = backend.get_bulb_for_zone(ppg_id)
@@ -674,16 +769,14 @@ class FastAttackProgram(LightingProgram):
         # Get colors from config
         zone_cfg = backend.config['zones'][ppg_id]
         hue = zone_cfg['hue']
-        saturation = backend.config['effects'].get('baseline_saturation', 75)
-        baseline_bri = backend.config['effects'].get('baseline_brightness', 40)
-        pulse_max = backend.config['effects'].get('pulse_max', 70)
-        attack_time_ms = backend.config['effects'].get('attack_time_ms', 200)
-        sustain_time_ms = backend.config['effects'].get('sustain_time_ms', 100)
+        saturation = state['saturation']
+        baseline_bri = state['baseline_bri']
+        pulse_max = state['pulse_max']
+        attack_time_ms = state['attack_time_ms']
+        sustain_time_ms = state['sustain_time_ms']
 
         # Calculate fade duration (smallest multiple of IBI >= 2000ms)
-        ibi_ms = 60000.0 / bpm
-        fade_beats = math.ceil(2000.0 / ibi_ms)
-        fade_ms = int(fade_beats * ibi_ms)
+        fade_beats, fade_ms = _fade_duration(bpm)
 
         # Calculate total pulse cycle duration
         attack_sustain_ms = attack_time_ms + sustain_time_ms
@@ -700,8 +793,8 @@ class FastAttackProgram(LightingProgram):
         backend.set_color_delayed(bulb_id, hue, saturation, baseline_bri, attack_sustain_ms, transition=fade_ms)
 
         zone_name = zone_cfg.get('name', f'Zone {ppg_id}')
-        logger.info(f"FAST_ATTACK: {zone_name} (PPG {ppg_id}), BPM={bpm:.1f}, "
-                    f"sustain={attack_sustain_ms}ms, fade={fade_beats} beats ({fade_ms}ms)")
+        logger.info("FAST_ATTACK: %s (PPG %d), BPM=%.1f, sustain=%sms, fade=%d beats (%dms)",
+                    zone_name, ppg_id, bpm, attack_sustain_ms, fade_beats, fade_ms)
 
     def on_cleanup(self, state: dict, backend: 'KasaBackend') -> None:
         """Cleanup: log statistics and leave bulbs in current state."""
@@ -741,15 +834,17 @@ class SlowPulseProgram(LightingProgram):
         """Initialize slow pulse with per-zone state machines."""
         backend.set_all_baseline()
 
-        # Per-zone state tracking
-        zone_states = {}
-        for zone in range(4):
-            zone_states[zone] = {
-                'phase': 'at_baseline',  # at_baseline | fade_in_active | at_peak_waiting | fade_out_active
-                'transition_start_ms': 0.0,
-                'fade_duration_ms': 2000,
-            }
-        return {'zones': zone_states}
+        # Per-zone state tracking (list indexed by zone)
+        zone_states = [FadeZoneState() for _ in range(4)]
+
+        effects = config.get('effects') or {}
+        return {
+            'zones': zone_states,
+            'next_due_ms': inf,  # Earliest active fade deadline (monotonic ms)
+            'saturation': effects.get('baseline_saturation', 75),
+            'baseline_bri': effects.get('baseline_brightness', 40),
+            'pulse_max': effects.get('pulse_max', 70),
+        }
 
     def on_beat(self, state: dict, ppg_id: int, timestamp_ms: int, bpm: float,
                 intensity: float, backend: 'KasaBackend') -> None:
@@ -760,11 +855,11 @@ class SlowPulseProgram(LightingProgram):
             return
 
         zone_state = state['zones'][ppg_id]
-        phase = zone_state['phase']
+        phase = zone_state.phase
 
         # Only respond to beats in stable states (not during active transitions)
         if phase not in ['at_baseline', 'at_peak_waiting']:
-            logger.debug(f"SLOW_PULSE Zone {ppg_id}: Ignoring beat during {phase}")
+            logger.debug("SLOW_PULSE Zone %d: Ignoring beat during %s", ppg_id, phase)
             return
 
         bulb_id = backend.get_bulb_for_zone(ppg_id)
@@ -775,53 +870,66 @@ class SlowPulseProgram(LightingProgram):
         # Get config values
         zone_cfg = backend.config['zones'][ppg_id]
         hue = zone_cfg['hue']
-        saturation = backend.config['effects'].get('baseline_saturation', 75)
-        baseline_bri = backend.config['effects'].get('baseline_brightness', 40)
-        pulse_max = backend.config['effects'].get('pulse_max', 70)
+        saturation = state['saturation']
+        baseline_bri = state['baseline_bri']
+        pulse_max = state['pulse_max']
 
         # Calculate fade duration (smallest multiple of IBI >= 2000ms)
-        ibi_ms = 60000.0 / bpm
-        fade_beats = math.ceil(2000.0 / ibi_ms)
-        fade_ms = int(fade_beats * ibi_ms)
-        zone_state['fade_duration_ms'] = fade_ms
+        fade_beats, fade_ms = _fade_duration(bpm)
+        zone_state.fade_duration_ms = fade_ms
+        start_ms = time.monotonic_ns() // 1_000_000
+        state['next_due_ms'] = min(state['next_due_ms'], start_ms + fade_ms)
 
         zone_name = zone_cfg.get('name', f'Zone {ppg_id}')
 
         if phase == 'at_baseline':
             # Start fade-in to peak
             backend.set_color(bulb_id, hue, saturation, pulse_max, transition=fade_ms)
-            zone_state['phase'] = 'fade_in_active'
-            zone_state['transition_start_ms'] = timestamp_ms
-            logger.info(f"SLOW_PULSE {zone_name}: Fade-in start "
-                        f"({fade_beats} beats, {fade_ms}ms) @ BPM={bpm:.1f}")
+            zone_state.phase = 'fade_in_active'
+            zone_state.transition_start_ms = start_ms
+            logger.info("SLOW_PULSE %s: Fade-in start (%d beats, %dms) @ BPM=%.1f",
+                        zone_name, fade_beats, fade_ms, bpm)
 
         elif phase == 'at_peak_waiting':
             # Start fade-out to baseline
             backend.set_color(bulb_id, hue, saturation, baseline_bri, transition=fade_ms)
-            zone_state['phase'] = 'fade_out_active'
-            zone_state['transition_start_ms'] = timestamp_ms
-            logger.info(f"SLOW_PULSE {zone_name}: Fade-out start "
-                        f"({fade_beats} beats, {fade_ms}ms) @ BPM={bpm:.1f}")
+            zone_state.phase = 'fade_out_active'
+            zone_state.transition_start_ms = start_ms
+            logger.info("SLOW_PULSE %s: Fade-out start (%d beats, %dms) @ BPM=%.1f",
+                        zone_name, fade_beats, fade_ms, bpm)
 
     def on_tick(self, state: dict, dt: float, backend: 'KasaBackend') -> None:
         """Check for transition completion and advance state machine."""
-        current_time_ms = time.time() * 1000
+        # Monotonic clock: fades are timed from when on_beat issued them,
+        # not from the beat's wall-clock timestamp, so NTP jumps can't stall them
+        current_time_ms = time.monotonic_ns() // 1_000_000
 
-        for zone in range(4):
-            zone_state = state['zones'][zone]
-            phase = zone_state['phase']
+        # No fade can finish before the earliest deadline set in on_beat
+        if current_time_ms < state['next_due_ms']:
+            return
 
-            if phase in ['fade_in_active', 'fade_out_active']:
-                elapsed_ms = current_time_ms - zone_state['transition_start_ms']
+        next_due_ms = inf
+        for zone, zone_state in enumerate(state['zones']):
+            phase = zone_state.phase
 
-                if elapsed_ms >= zone_state['fade_duration_ms']:
-                    # Transition complete
-                    if phase == 'fade_in_active':
-                        zone_state['phase'] = 'at_peak_waiting'
-                        logger.debug(f"SLOW_PULSE Zone {zone}: Reached peak, waiting for beat")
-                    else:  # fade_out_active
-                        zone_state['phase'] = 'at_baseline'
-                        logger.debug(f"SLOW_PULSE Zone {zone}: Back at baseline, waiting for beat")
+            # Stable zones have nothing to advance
+            if phase == 'at_baseline' or phase == 'at_peak_waiting':
+                continue
+
+            due_ms = zone_state.transition_start_ms + zone_state.fade_duration_ms
+            if current_time_ms < due_ms:
+                next_due_ms = min(next_due_ms, due_ms)
+                continue
+
+            # Transition complete
+            if phase == 'fade_in_active':
+                zone_state.phase = 'at_peak_waiting'
+                logger.debug("SLOW_PULSE Zone %d: Reached peak, waiting for beat", zone)
+            else:  # fade_out_active
+                zone_state.phase = 'at_baseline'
+                logger.debug("SLOW_PULSE Zone %d: Back at baseline, waiting for beat", zone)
+
+        state['next_due_ms'] = next_due_ms
 
     def on_cleanup(self, state: dict, backend: 'KasaBackend') -> None:
         """Cleanup: bulbs remain in current state."""
@@ -848,23 +956,22 @@ class IntensitySlowPulseProgram(LightingProgram):
     def on_init(self, config: dict, backend: 'KasaBackend') -> dict:
         """Initialize slow pulse with intensity tracking."""
         prog_config = config.get('program', {}).get('config', {})
+        effects = config.get('effects') or {}
         backend.set_all_baseline()
 
-        # Per-zone state tracking
-        zone_states = {}
-        for zone in range(4):
-            zone_states[zone] = {
-                'phase': 'at_baseline',
-                'transition_start_ms': 0.0,
-                'fade_duration_ms': 2000,
-                'hue': 200,  # Default calm blue
-                'saturation': 75,  # Default saturation
-            }
+        # Per-zone state tracking (list indexed by zone)
+        zone_states = [FadeZoneState() for _ in range(4)]
 
+        min_saturation = prog_config.get('min_saturation', 50)
+        max_saturation = prog_config.get('max_saturation', 100)
         return {
             'zones': zone_states,
-            'min_saturation': prog_config.get('min_saturation', 50),
-            'max_saturation': prog_config.get('max_saturation', 100),
+            'next_due_ms': inf,  # Earliest active fade deadline (monotonic ms)
+            'min_saturation': min_saturation,
+            'max_saturation': max_saturation,
+            'saturation_range': max_saturation - min_saturation,
+            'baseline_bri': effects.get('baseline_brightness', 40),
+            'pulse_max': effects.get('pulse_max', 70),
         }
 
     def on_beat(self, state: dict, ppg_id: int, timestamp_ms: int, bpm: float,
@@ -874,7 +981,7 @@ class IntensitySlowPulseProgram(LightingProgram):
             return
 
         zone_state = state['zones'][ppg_id]
-        phase = zone_state['phase']
+        phase = zone_state.phase
 
         # Only respond to beats in stable states
         if phase not in ['at_baseline', 'at_peak_waiting']:
@@ -885,57 +992,67 @@ class IntensitySlowPulseProgram(LightingProgram):
             return
 
         # Calculate reactive hue from BPM (40 BPM=blue/240°, 120 BPM=red/0°)
-        bpm_clamped = min(max(bpm, 40), 120)
-        hue = int((120 - bpm_clamped) * 3)
-        zone_state['hue'] = hue
+        hue = _BPM_HUE_LUT[min(max(int(bpm), _BPM_HUE_MIN), _BPM_HUE_MAX) - _BPM_HUE_MIN]
+        zone_state.hue = hue
 
         # Calculate saturation from intensity
-        saturation_range = state['max_saturation'] - state['min_saturation']
-        saturation = int(state['min_saturation'] + intensity * saturation_range)
-        zone_state['saturation'] = saturation
+        saturation = int(state['min_saturation'] + intensity * state['saturation_range'])
+        zone_state.saturation = saturation
 
         # Get brightness values
-        baseline_bri = backend.config['effects'].get('baseline_brightness', 40)
-        pulse_max = backend.config['effects'].get('pulse_max', 70)
+        baseline_bri = state['baseline_bri']
+        pulse_max = state['pulse_max']
 
         # Calculate fade duration (smallest multiple of IBI >= 2000ms)
-        ibi_ms = 60000.0 / bpm
-        fade_beats = math.ceil(2000.0 / ibi_ms)
-        fade_ms = int(fade_beats * ibi_ms)
-        zone_state['fade_duration_ms'] = fade_ms
+        fade_beats, fade_ms = _fade_duration(bpm)
+        zone_state.fade_duration_ms = fade_ms
+        start_ms = time.monotonic_ns() // 1_000_000
+        state['next_due_ms'] = min(state['next_due_ms'], start_ms + fade_ms)
 
         if phase == 'at_baseline':
             # Start fade-in to peak
             backend.set_color(bulb_id, hue, saturation, pulse_max, transition=fade_ms)
-            zone_state['phase'] = 'fade_in_active'
-            zone_state['transition_start_ms'] = timestamp_ms
-            logger.info(f"INTENSITY_SLOW_PULSE Zone {ppg_id}: Fade-in, BPM={bpm:.1f}, "
-                        f"Intensity={intensity:.2f}, Hue={hue}°, Sat={saturation}%")
+            zone_state.phase = 'fade_in_active'
+            zone_state.transition_start_ms = start_ms
+            logger.info("INTENSITY_SLOW_PULSE Zone %d: Fade-in, BPM=%.1f, Intensity=%.2f, Hue=%d°, Sat=%d%%",
+                        ppg_id, bpm, intensity, hue, saturation)
 
         elif phase == 'at_peak_waiting':
             # Start fade-out to baseline
             backend.set_color(bulb_id, hue, saturation, baseline_bri, transition=fade_ms)
-            zone_state['phase'] = 'fade_out_active'
-            zone_state['transition_start_ms'] = timestamp_ms
-            logger.info(f"INTENSITY_SLOW_PULSE Zone {ppg_id}: Fade-out, BPM={bpm:.1f}")
+            zone_state.phase = 'fade_out_active'
+            zone_state.transition_start_ms = start_ms
+            logger.info("INTENSITY_SLOW_PULSE Zone %d: Fade-out, BPM=%.1f", ppg_id, bpm)
 
     def on_tick(self, state: dict, dt: float, backend: 'KasaBackend') -> None:
         """Check for transition completion and advance state machine."""
-        current_time_ms = time.time() * 1000
+        # Monotonic ms, matching transition_start_ms set in on_beat
+        current_time_ms = time.monotonic_ns() // 1_000_000
 
-        for zone in range(4):
-            zone_state = state['zones'][zone]
-            phase = zone_state['phase']
+        # No fade can finish before the earliest deadline set in on_beat
+        if current_time_ms < state['next_due_ms']:
+            return
 
-            if phase in ['fade_in_active', 'fade_out_active']:
-                elapsed_ms = current_time_ms - zone_state['transition_start_ms']
+        next_due_ms = inf
+        for zone_state in state['zones']:
+            phase = zone_state.phase
 
-                if elapsed_ms >= zone_state['fade_duration_ms']:
-                    # Transition complete
-                    if phase == 'fade_in_active':
-                        zone_state['phase'] = 'at_peak_waiting'
-                    else:  # fade_out_active
-                        zone_state['phase'] = 'at_baseline'
+            # Stable zones have nothing to advance
+            if phase == 'at_baseline' or phase == 'at_peak_waiting':
+                continue
+
+            due_ms = zone_state.transition_start_ms + zone_state.fade_duration_ms
+            if current_time_ms < due_ms:
+                next_due_ms = min(next_due_ms, due_ms)
+                continue
+
+            # Transition complete
+            if phase == 'fade_in_active':
+                zone_state.phase = 'at_peak_waiting'
+            else:  # fade_out_active
+                zone_state.phase = 'at_baseline'
+
+        state['next_due_ms'] = next_due_ms
 
     def on_cleanup(self, state: dict, backend: 'KasaBackend') -> None:
         """Cleanup: bulbs remain in current state."""
@@ -965,7 +1082,13 @@ class InstantPulseProgram(LightingProgram):
         for zone in range(4):
             zone_states[zone] = {'at_peak': False}
 
-        return {'zones': zone_states}
+        effects = config.get('effects') or {}
+        return {
+            'zones': zone_states,
+            'saturation': effects.get('baseline_saturation', 75),
+            'baseline_bri': effects.get('baseline_brightness', 10),
+            'pulse_max': effects.get('pulse_max', 100),
+        }
 
     def on_beat(self, state: dict, ppg_id: int, timestamp_ms: int, bpm: float,
                 intensity: float, backend: 'KasaBackend') -> None:
@@ -980,9 +1103,9 @@ class InstantPulseProgram(LightingProgram):
         # Get config values
         zone_cfg = backend.config['zones'][ppg_id]
         hue = zone_cfg['hue']
-        saturation = backend.config['effects'].get('baseline_saturation', 75)
-        baseline_bri = backend.config['effects'].get('baseline_brightness', 10)
-        pulse_max = backend.config['effects'].get('pulse_max', 100)
+        saturation = state['saturation']
+        baseline_bri = state['baseline_bri']
+        pulse_max = state['pulse_max']
 
         # Toggle state
         zone_state = state['zones'][ppg_id]
@@ -994,8 +1117,8 @@ class InstantPulseProgram(LightingProgram):
 
         zone_name = zone_cfg.get('name', f'Zone {ppg_id}')
         state_str = "PEAK" if zone_state['at_peak'] else "BASELINE"
-        logger.info(f"INSTANT_PULSE: {zone_name} (PPG {ppg_id}), "
-                    f"{state_str} ({target_bri}%), BPM={bpm:.1f}")
+        logger.info("INSTANT_PULSE: %s (PPG %d), %s (%s%%), BPM=%.1f",
+                    zone_name, ppg_id, state_str, target_bri, bpm)
 
     def on_cleanup(self, state: dict, backend: 'KasaBackend') -> None:
         """Cleanup: bulbs remain in current state."""
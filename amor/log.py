@@ -17,24 +17,34 @@ class AmorFormatter(logging.Formatter):
     Example: [I 14:23:45.123 audio    ] Audio engine started
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Padded module name per logger name
+        self._module_cache = {}
+        # Whole second of the last record and its formatted %H:%M:%S
+        self._last_second = None
+        self._last_timestamp = ""
+
     def format(self, record):
         # Get first character of level name
         level_char = record.levelname[0]
 
-        # Get module basename (last part after dot)
-        module_name = record.name.split('.')[-1]
-        # Truncate to 9 chars and right-pad
-        module_padded = module_name[:9].ljust(9)
+        # Module basename (last part after dot), truncated to 9 chars and
+        # right-padded; cached since a formatter only sees a few logger names
+        module_padded = self._module_cache.get(record.name)
+        if module_padded is None:
+            module_padded = record.name.rsplit('.', 1)[-1][:9].ljust(9)
+            self._module_cache[record.name] = module_padded
 
-        # Format timestamp with milliseconds
-        timestamp = self.formatTime(record, "%H:%M:%S")
-        msecs = f"{record.msecs:03.0f}"
+        # Format timestamp, reusing the strftime result within the same second
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_timestamp = self.formatTime(record, "%H:%M:%S")
+            self._last_second = second
+        timestamp = self._last_timestamp
 
         # Build the log line
-        prefix = f"[{level_char} {timestamp}.{msecs} {module_padded}]"
-        message = record.getMessage()
-
-        return f"{prefix} {message}"
+        return f"[{level_char} {timestamp}.{record.msecs:03.0f} {module_padded}] {record.getMessage()}"
 
 
 def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
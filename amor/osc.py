@@ -28,10 +28,11 @@ Constants:
     - SAMPLE_RATE_HZ: PPG sampling rate
 """
 
-import re
 import socket
 import threading
-from typing import Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+from pythonosc import osc_bundle_builder
 from pythonosc import osc_server
 from pythonosc import udp_client
 
@@ -55,16 +56,17 @@ PORT_ESP32_ADMIN = 8006  # ESP32 admin commands (Admin → ESP32 units)
 # Stereo panning positions for each PPG channel (8 total)
 # -1.0 = hard left, 0.0 = center, 1.0 = hard right
 # Channels 4-7 (virtual) inherit pan positions from 0-3 (real sensors)
-PPG_PANS = {
-    0: -1.0,   # Real sensor 0: Hard left
-    1: -0.33,  # Real sensor 1: Center-left
-    2: 0.33,   # Real sensor 2: Center-right
-    3: 1.0,    # Real sensor 3: Hard right
-    4: -1.0,   # Virtual channel 4: Hard left (inherits from 0)
-    5: -0.33,  # Virtual channel 5: Center-left (inherits from 1)
-    6: 0.33,   # Virtual channel 6: Center-right (inherits from 2)
-    7: 1.0     # Virtual channel 7: Hard right (inherits from 3)
-}
+# Indexed by PPG ID; a tuple since IDs are dense 0-7
+PPG_PANS = (
+    -1.0,   # Real sensor 0: Hard left
+    -0.33,  # Real sensor 1: Center-left
+    0.33,   # Real sensor 2: Center-right
+    1.0,    # Real sensor 3: Hard right
+    -1.0,   # Virtual channel 4: Hard left (inherits from 0)
+    -0.33,  # Virtual channel 5: Center-left (inherits from 1)
+    0.33,   # Virtual channel 6: Center-right (inherits from 2)
+    1.0,    # Virtual channel 7: Hard right (inherits from 3)
+)
 
 # 12-bit ADC range from ESP32
 ADC_MIN = 0
@@ -77,12 +79,22 @@ SAMPLE_RATE_HZ = 50
 PORT_MIN = 1
 PORT_MAX = 65535
 
-# Pre-compiled regex patterns for address validation
+# Largest OSC bundle BroadcastUDPClient.batch() sends in one datagram
+# (stays under a 1500-byte Ethernet MTU so broadcasts are not fragmented)
+MAX_BUNDLE_BYTES = 1400
+
+# Separator line for MessageStatistics.print_stats()
+_STATS_SEPARATOR = "=" * 60
+
+# Lookup tables for address validation (address string → PPG ID)
 # Support 8 PPG channels: 0-3 (real sensors), 4-7 (virtual channels)
-PPG_ADDRESS_PATTERN = re.compile(r'^/ppg/([0-7])$')
-BEAT_ADDRESS_PATTERN = re.compile(r'^/beat/([0-7])$')
-ACQUIRE_ADDRESS_PATTERN = re.compile(r'^/acquire/([0-7])$')
-RELEASE_ADDRESS_PATTERN = re.compile(r'^/release/([0-7])$')
+# Only 8 addresses are legal per prefix, so a dict hit replaces a regex match.
+# Handlers that drop invalid messages silently can call .get(address) directly
+# (None if invalid); the validate_*_address functions add the error message.
+PPG_ADDRESSES = {f"/ppg/{i}": i for i in range(8)}
+BEAT_ADDRESSES = {f"/beat/{i}": i for i in range(8)}
+ACQUIRE_ADDRESSES = {f"/acquire/{i}": i for i in range(8)}
+RELEASE_ADDRESSES = {f"/release/{i}": i for i in range(8)}
 
 
 # ============================================================================
@@ -193,6 +205,70 @@ class BroadcastUDPClient(udp_client.SimpleUDPClient):
         super().__init__(address, port)
         # Enable broadcast on the socket
         self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        # Pending messages while inside batch(), None when sending directly
+        self._batch = None
+        self._batch_bytes = 0
+        self._batch_depth = 0
+
+    def send(self, content):
+        """Send an OSC message or bundle, or queue it while batching."""
+        if self._batch is None:
+            super().send(content)
+            return
+
+        # Element size prefix (4 bytes) + content; flush before overflowing
+        if self._batch and self._batch_bytes + 4 + content.size > MAX_BUNDLE_BYTES:
+            self._flush_batch()
+        self._batch.append(content)
+        self._batch_bytes += 4 + content.size
+
+    @contextmanager
+    def batch(self):
+        """Coalesce messages sent inside the block into OSC bundles.
+
+        Messages are sent on exit as immediate-timetag bundles of at most
+        MAX_BUNDLE_BYTES, preserving order. pythonosc dispatchers unpack
+        bundles and invoke handlers per message, so receivers are unaffected.
+        Nested batch() blocks join the outermost one.
+
+        Not thread-safe: only the thread that opened the batch should send
+        on this client until the block exits.
+
+        Example:
+            >>> with client.batch():
+            ...     for col in range(8):
+            ...         client.send_message(f"/led/0/{col}", [color, mode])
+        """
+        if self._batch_depth == 0:
+            self._batch = []
+            self._batch_bytes = 0
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                try:
+                    self._flush_batch()
+                finally:
+                    self._batch = None
+
+    def _flush_batch(self):
+        """Send queued messages as one datagram and reset the queue."""
+        pending = self._batch
+        if not pending:
+            return
+        self._batch = []
+        self._batch_bytes = 0
+
+        if len(pending) == 1:
+            super().send(pending[0])
+            return
+
+        builder = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+        for content in pending:
+            builder.add_content(content)
+        super().send(builder.build())
 
     def close(self):
         """Close the UDP socket."""
@@ -213,10 +289,39 @@ class BroadcastUDPClient(udp_client.SimpleUDPClient):
 # VALIDATION FUNCTIONS
 # ============================================================================
 
+def _valid_results(addresses: Dict[str, int]) -> Dict[str, Tuple[bool, Optional[int], Optional[str]]]:
+    """Prebuild the (True, ppg_id, None) result for each valid address."""
+    return {address: (True, ppg_id, None) for address, ppg_id in addresses.items()}
+
+
+# Valid-address results per message family; the success path allocates nothing
+_PPG_RESULTS = _valid_results(PPG_ADDRESSES)
+_BEAT_RESULTS = _valid_results(BEAT_ADDRESSES)
+_ACQUIRE_RESULTS = _valid_results(ACQUIRE_ADDRESSES)
+_RELEASE_RESULTS = _valid_results(RELEASE_ADDRESSES)
+
+
+def _lookup_address(results: Dict[str, Tuple[bool, Optional[int], Optional[str]]],
+                    address: str) -> Tuple[bool, Optional[int], Optional[str]]:
+    """Look up an address in a prebuilt result table (one dict lookup).
+
+    Args:
+        results: Mapping of valid address string → (True, ppg_id, None)
+        address: OSC address string to validate
+
+    Returns:
+        Tuple of (is_valid, ppg_id, error_message)
+    """
+    result = results.get(address)
+    if result is None:
+        return False, None, f"Invalid address pattern: {address}"
+    return result
+
+
 def validate_ppg_address(address: str) -> Tuple[bool, Optional[int], Optional[str]]:
     """Validate PPG message OSC address pattern.
 
-    Checks if address matches /ppg/[0-3] pattern and extracts PPG ID.
+    Checks if address is one of /ppg/0 through /ppg/7 and extracts PPG ID.
 
     Args:
         address: OSC address string (e.g., "/ppg/0")
@@ -224,26 +329,22 @@ def validate_ppg_address(address: str) -> Tuple[bool, Optional[int], Optional[st
     Returns:
         Tuple of (is_valid, ppg_id, error_message):
             - is_valid: True if address matches pattern
-            - ppg_id: Extracted sensor ID 0-3, None if invalid
+            - ppg_id: Extracted sensor ID 0-7, None if invalid
             - error_message: Human-readable error if invalid, None if valid
 
     Examples:
-        >>> validate_ppg_address("/ppg/0")
-        (True, 0, None)
-        >>> validate_ppg_address("/ppg/5")
-        (False, None, "Invalid address pattern: /ppg/5")
+        >>> validate_ppg_address("/ppg/2")
+        (True, 2, None)
+        >>> validate_ppg_address("/ppg/invalid")
+        (False, None, "Invalid address pattern: /ppg/invalid")
     """
-    match = PPG_ADDRESS_PATTERN.match(address)
-    if not match:
-        return False, None, f"Invalid address pattern: {address}"
-    ppg_id = int(match.group(1))
-    return True, ppg_id, None
+    return _lookup_address(_PPG_RESULTS, address)
 
 
 def validate_beat_address(address: str) -> Tuple[bool, Optional[int], Optional[str]]:
     """Validate beat message OSC address pattern.
 
-    Checks if address matches /beat/[0-3] pattern and extracts PPG ID.
+    Checks if address is one of /beat/0 through /beat/7 and extracts PPG ID.
 
     Args:
         address: OSC address string (e.g., "/beat/0")
@@ -251,7 +352,7 @@ def validate_beat_address(address: str) -> Tuple[bool, Optional[int], Optional[s
     Returns:
         Tuple of (is_valid, ppg_id, error_message):
             - is_valid: True if address matches pattern
-            - ppg_id: Extracted sensor ID 0-3, None if invalid
+            - ppg_id: Extracted sensor ID 0-7, None if invalid
             - error_message: Human-readable error if invalid, None if valid
 
     Examples:
@@ -260,17 +361,13 @@ def validate_beat_address(address: str) -> Tuple[bool, Optional[int], Optional[s
         >>> validate_beat_address("/beat/invalid")
         (False, None, "Invalid address pattern: /beat/invalid")
     """
-    match = BEAT_ADDRESS_PATTERN.match(address)
-    if not match:
-        return False, None, f"Invalid address pattern: {address}"
-    ppg_id = int(match.group(1))
-    return True, ppg_id, None
+    return _lookup_address(_BEAT_RESULTS, address)
 
 
 def validate_acquire_address(address: str) -> Tuple[bool, Optional[int], Optional[str]]:
     """Validate acquire message OSC address pattern.
 
-    Checks if address matches /acquire/[0-3] pattern and extracts PPG ID.
+    Checks if address is one of /acquire/0 through /acquire/7 and extracts PPG ID.
 
     Args:
         address: OSC address string (e.g., "/acquire/0")
@@ -278,7 +375,7 @@ def validate_acquire_address(address: str) -> Tuple[bool, Optional[int], Optiona
     Returns:
         Tuple of (is_valid, ppg_id, error_message):
             - is_valid: True if address matches pattern
-            - ppg_id: Extracted sensor ID 0-3, None if invalid
+            - ppg_id: Extracted sensor ID 0-7, None if invalid
             - error_message: Human-readable error if invalid, None if valid
 
     Examples:
@@ -287,17 +384,13 @@ def validate_acquire_address(address: str) -> Tuple[bool, Optional[int], Optiona
         >>> validate_acquire_address("/acquire/invalid")
         (False, None, "Invalid address pattern: /acquire/invalid")
     """
-    match = ACQUIRE_ADDRESS_PATTERN.match(address)
-    if not match:
-        return False, None, f"Invalid address pattern: {address}"
-    ppg_id = int(match.group(1))
-    return True, ppg_id, None
+    return _lookup_address(_ACQUIRE_RESULTS, address)
 
 
 def validate_release_address(address: str) -> Tuple[bool, Optional[int], Optional[str]]:
     """Validate release message OSC address pattern.
 
-    Checks if address matches /release/[0-3] pattern and extracts PPG ID.
+    Checks if address is one of /release/0 through /release/7 and extracts PPG ID.
 
     Args:
         address: OSC address string (e.g., "/release/0")
@@ -305,7 +398,7 @@ def validate_release_address(address: str) -> Tuple[bool, Optional[int], Optiona
     Returns:
         Tuple of (is_valid, ppg_id, error_message):
             - is_valid: True if address matches pattern
-            - ppg_id: Extracted sensor ID 0-3, None if invalid
+            - ppg_id: Extracted sensor ID 0-7, None if invalid
             - error_message: Human-readable error if invalid, None if valid
 
     Examples:
@@ -314,11 +407,7 @@ def validate_release_address(address: str) -> Tuple[bool, Optional[int], Optiona
         >>> validate_release_address("/release/invalid")
         (False, None, "Invalid address pattern: /release/invalid")
     """
-    match = RELEASE_ADDRESS_PATTERN.match(address)
-    if not match:
-        return False, None, f"Invalid address pattern: {address}"
-    ppg_id = int(match.group(1))
-    return True, ppg_id, None
+    return _lookup_address(_RELEASE_RESULTS, address)
 
 
 def validate_port(port: int) -> None:
@@ -335,7 +424,7 @@ def validate_port(port: int) -> None:
         >>> validate_port(0)  # Raises ValueError
         >>> validate_port(70000)  # Raises ValueError
     """
-    if port < PORT_MIN or port > PORT_MAX:
+    if not PORT_MIN <= port <= PORT_MAX:
         raise ValueError(f"Port must be in range {PORT_MIN}-{PORT_MAX}, got {port}")
 
 
@@ -355,7 +444,7 @@ def validate_ppg_id(ppg_id: int) -> None:
         >>> validate_ppg_id(7)  # OK (virtual channel)
         >>> validate_ppg_id(8)  # Raises ValueError
     """
-    if ppg_id < 0 or ppg_id > 7:
+    if not 0 <= ppg_id <= 7:
         raise ValueError(f"PPG ID must be in range 0-7, got {ppg_id}")
 
 
@@ -392,6 +481,8 @@ class MessageStatistics:
         """Initialize statistics tracker with empty counters."""
         self.counters = {}
         self.lock = threading.Lock()
+        # Title Case display name per counter, filled when a counter is created
+        self._display_names = {}
 
     def increment(self, counter_name: str, amount: int = 1) -> None:
         """Increment a counter by specified amount (thread-safe).
@@ -402,9 +493,20 @@ class MessageStatistics:
 
         Side effects:
             Creates counter if it doesn't exist (initialized to 0 before increment)
+
+        Note:
+            The lock stays: `+=` on a dict item is a read-modify-write that the
+            GIL does not make atomic. It is uncontended for the blocking servers
+            most modules use, so the cost is one acquire/release per call.
         """
+        counters = self.counters
         with self.lock:
-            self.counters[counter_name] = self.counters.get(counter_name, 0) + amount
+            if counter_name in counters:
+                counters[counter_name] += amount
+            else:
+                counters[counter_name] = amount
+                # Convert snake_case to Title Case for display
+                self._display_names[counter_name] = counter_name.replace('_', ' ').title()
 
     def get(self, counter_name: str) -> int:
         """Get current value of a counter (thread-safe).
@@ -437,21 +539,19 @@ class MessageStatistics:
             ...
             ============================================================
         """
-        logger.info("\n" + "=" * 60)
-        logger.info(title)
-        logger.info("=" * 60)
-
         # Snapshot counters under lock (fast)
         with self.lock:
             snapshot = dict(self.counters)
+            display_names = dict(self._display_names)
 
-        # Log without holding lock (slow I/O)
+        # Build the block without holding lock, then log it as one record so
+        # concurrent log lines cannot interleave with it
+        lines = ["", _STATS_SEPARATOR, title, _STATS_SEPARATOR]
         for name in sorted(snapshot.keys()):
-            # Convert snake_case to Title Case for display
-            display_name = name.replace('_', ' ').title()
-            logger.info(f"{display_name}: {snapshot[name]}")
+            lines.append(f"{display_names[name]}: {snapshot[name]}")
+        lines.append(_STATS_SEPARATOR)
 
-        logger.info("=" * 60)
+        logger.info("\n".join(lines))
 
 
 # ============================================================================
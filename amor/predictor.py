@@ -36,8 +36,11 @@ USAGE:
 Reference: Design document at docs/amor-heartbeat-prediction-design.md
 """
 
+from collections import deque
 from dataclasses import dataclass
+from statistics import median_high
 from typing import Optional
+import math
 import time
 import threading
 
@@ -58,11 +61,13 @@ PHASE_CORRECTION_MAX = 0.2     # Maximum phase correction per observation (preve
 
 # Observation filtering
 OBSERVATION_DEBOUNCE = 0.7     # Accept crossings ≥ 0.7 × IBI apart
+DEBOUNCE_FLOOR_MS = OBSERVATION_DEBOUNCE * IBI_MIN_MS  # Smallest possible debounce window (280ms)
 
 # Confidence parameters
 CONFIDENCE_RAMP_PER_BEAT = 0.2 # Confidence increase per observation (0.2 = 20%)
 FADEIN_DURATION_MS = 5000      # Time from confidence 0.0 → 1.0 (5 seconds)
 COASTING_DURATION_MS = 10000   # Time from confidence 1.0 → 0.0 (10 seconds)
+COASTING_DECAY_PER_MS = 1.0 / COASTING_DURATION_MS  # Confidence lost per ms while coasting
 INIT_OBSERVATIONS = 5          # Observations needed for full confidence
 CONFIDENCE_EMISSION_MIN = 0.0  # Minimum confidence to emit beats (0 = always emit if >0)
 
@@ -71,6 +76,8 @@ UPDATE_RATE_HZ = 50            # Predictor update() calls per second
 
 # Autonomous beat emission
 BEAT_LEAD_TIME_S = 0.2         # Emit beats 200ms before predicted beat time
+EMISSION_IDLE_WAIT_S = 1.0     # Backstop re-check while idle (state changes wake the thread)
+BEAT_LOG_EVERY = 10            # Beats per INFO summary line (each beat is logged at DEBUG)
 
 
 @dataclass
@@ -82,6 +89,8 @@ class BeatMessage:
         bpm (float): Beats per minute derived from IBI estimate
         intensity (float): Confidence level (0.0-1.0) indicating model certainty
     """
+    __slots__ = ('timestamp', 'bpm', 'intensity')
+
     timestamp: float
     bpm: float
     intensity: float
@@ -108,11 +117,25 @@ class HeartbeatPredictor:
         ibi_estimate_ms (float): Current IBI estimate in milliseconds
         confidence (float): Model confidence (0.0-1.0)
         last_update_time (float): Timestamp of last update() call (seconds)
-        last_beat_time (float): Timestamp when phase last crossed 1.0 (seconds)
+        last_beat_time (float): Scheduled time of the last emitted beat (time.monotonic() seconds)
         last_observation_time (float): Timestamp of last accepted observation (seconds)
-        init_observations (list): Collected observations during initialization
+        init_observations (deque): Most recent INIT_OBSERVATIONS observations during initialization
     """
 
+    # Fixed attribute set: no per-instance __dict__, faster access on the 50Hz path
+    __slots__ = (
+        'ppg_id', 'beats_port', 'lead_time_s', 'verbose', 'logger', 'mode',
+        'phase', 'ibi_estimate_ms', '_inv_ibi_ms', '_bpm',
+        '_ibi_accept_min', '_ibi_accept_max', 'confidence',
+        'last_update_time', 'last_beat_time', 'last_observation_time',
+        'fadein_start_time', '_fadein_start_confidence',
+        'init_observations', '_init_intervals',
+        'debounced_count', 'out_of_range_count', 'outlier_count',
+        'beats_client', '_beat_address', 'emission_thread', 'running',
+        '_beats_since_log', '_bpm_sum', '_intensity_sum',
+        'emission_lock', 'state_lock', '_wake',
+    )
+
     # Modes
     MODE_INITIALIZATION = "initialization"
     MODE_LOCKED = "locked"
@@ -141,6 +164,12 @@ class HeartbeatPredictor:
         # Phase and rhythm state
         self.phase: float = 0.0
         self.ibi_estimate_ms: Optional[float] = None
+        # Derived from ibi_estimate_ms by _set_ibi_estimate() (1/IBI and BPM)
+        self._inv_ibi_ms: Optional[float] = None
+        self._bpm: Optional[float] = None
+        # Accepted observed-IBI window: range check ∩ outlier bounds (ms)
+        self._ibi_accept_min: Optional[float] = None
+        self._ibi_accept_max: Optional[float] = None
 
         # Confidence state
         self.confidence: float = 0.0
@@ -150,9 +179,12 @@ class HeartbeatPredictor:
         self.last_beat_time: Optional[float] = None
         self.last_observation_time: Optional[float] = None
         self.fadein_start_time: Optional[float] = None  # For time-based fade-in
+        self._fadein_start_confidence: Optional[float] = None  # Confidence when fade-in began
 
-        # Initialization state
-        self.init_observations: list[float] = []
+        # Initialization state (bounded: a noisy start can't grow it indefinitely)
+        self.init_observations: deque = deque(maxlen=INIT_OBSERVATIONS)
+        # Intervals (ms) between consecutive init_observations, appended one per observation
+        self._init_intervals: deque = deque(maxlen=INIT_OBSERVATIONS - 1)
 
         # Observation rejection metrics (for debugging)
         self.debounced_count: int = 0
@@ -161,10 +193,17 @@ class HeartbeatPredictor:
 
         # Autonomous beat emission (threading)
         self.beats_client: Optional[osc.BroadcastUDPClient] = None
+        self._beat_address = f"/beat/{ppg_id}"  # Fixed per sensor, built once
+
+        # Beat log summary (emission thread only)
+        self._beats_since_log: int = 0
+        self._bpm_sum: float = 0.0
+        self._intensity_sum: float = 0.0
         self.emission_thread: Optional[threading.Thread] = None
         self.running: bool = False
         self.emission_lock = threading.Lock()  # Protects running flag
         self.state_lock = threading.Lock()  # Protects phase, IBI, confidence
+        self._wake = threading.Event()  # Wakes idle emission thread when beats become emittable
 
     def observe_crossing(self, timestamp_s: float) -> None:
         """Record threshold crossing observation from detector (thread-safe).
@@ -180,6 +219,19 @@ class HeartbeatPredictor:
             Initialization: Accumulates observations until INIT_OBSERVATIONS reached
             Locked/Coasting: Updates IBI and phase, resets coasting decay
         """
+        # Fast path for noisy sensors: a crossing closer than the smallest
+        # possible debounce window is always rejected by the locked check below,
+        # so skip the lock. IBI and last observation are only written from the
+        # processor thread that calls this method and update().
+        last_observation_time = self.last_observation_time
+        if last_observation_time is not None and self.ibi_estimate_ms is not None:
+            time_since_last = (timestamp_s - last_observation_time) * 1000.0  # ms
+            if time_since_last < DEBOUNCE_FLOOR_MS:
+                self.debounced_count += 1
+                self.logger.debug("PPG %d: Observation debounced - only %.0fms since last (floor %.0fms)",
+                                  self.ppg_id, time_since_last, DEBOUNCE_FLOOR_MS)
+                return
+
         with self.state_lock:
             # Debounce observations using current IBI estimate
             if self.ibi_estimate_ms is not None and self.last_observation_time is not None:
@@ -188,8 +240,8 @@ class HeartbeatPredictor:
 
                 if time_since_last < min_interval:
                     self.debounced_count += 1
-                    self.logger.debug(f"PPG {self.ppg_id}: Observation debounced - "
-                                      f"only {time_since_last:.0f}ms since last (min {min_interval:.0f}ms)")
+                    self.logger.debug("PPG %d: Observation debounced - only %.0fms since last (min %.0fms)",
+                                      self.ppg_id, time_since_last, min_interval)
                     return
 
             # Process observation based on current mode
@@ -242,20 +294,48 @@ class HeartbeatPredictor:
 
             # Advance phase
             time_delta_ms = time_delta_s * 1000.0
-            phase_increment = time_delta_ms / self.ibi_estimate_ms
+            phase_increment = time_delta_ms * self._inv_ibi_ms
             self.phase += phase_increment
 
-            # Wrap phase when it exceeds 1.0
-            while self.phase >= 1.0:
-                self.phase -= 1.0
+            # Wrap phase when it exceeds 1.0 (fmod bounds the cost after a long stall)
+            if self.phase >= 1.0:
+                self.phase = math.fmod(self.phase, 1.0)
 
             # Update confidence fade-in if active
             if self.fadein_start_time is not None:
                 self._update_fadein(timestamp_s)
 
-            # Update confidence decay if coasting
+            # Update confidence decay if coasting: linear over COASTING_DURATION_MS
+            # (inlined; time_delta_ms is non-negative, guarded above)
             if self.mode == self.MODE_COASTING:
-                self._update_coasting_decay(time_delta_ms)
+                # Decay only lowers confidence, so clamping at 0.0 keeps it in [0.0, 1.0]
+                confidence = self.confidence - COASTING_DECAY_PER_MS * time_delta_ms
+                if confidence > 0.0:
+                    self.confidence = confidence
+                else:
+                    self.confidence = 0.0
+                    self._enter_stopped()
+
+    def _set_ibi_estimate(self, ibi_ms: Optional[float]) -> None:
+        """Set IBI estimate along with its cached reciprocal, BPM and accept window.
+
+        Must be called with self.state_lock held so readers never see the
+        cached values out of step with ibi_estimate_ms.
+
+        Args:
+            ibi_ms: New IBI estimate in milliseconds, or None to clear
+        """
+        self.ibi_estimate_ms = ibi_ms
+        if ibi_ms is None:
+            self._inv_ibi_ms = None
+            self._bpm = None
+            self._ibi_accept_min = None
+            self._ibi_accept_max = None
+        else:
+            self._inv_ibi_ms = 1.0 / ibi_ms
+            self._bpm = 60000.0 * self._inv_ibi_ms
+            self._ibi_accept_min = max(IBI_MIN_MS, ibi_ms / IBI_OUTLIER_FACTOR)
+            self._ibi_accept_max = min(IBI_MAX_MS, ibi_ms * IBI_OUTLIER_FACTOR)
 
     def _begin_initialization(self, timestamp_s: float) -> None:
         """Begin initialization mode with first observation.
@@ -264,7 +344,9 @@ class HeartbeatPredictor:
             timestamp_s: First observation timestamp (seconds)
         """
         self.mode = self.MODE_INITIALIZATION
-        self.init_observations = [timestamp_s]
+        self.init_observations.clear()
+        self.init_observations.append(timestamp_s)
+        self._init_intervals.clear()
         # Clamp confidence to [0.0, 1.0] range for defensive programming
         self.confidence = max(0.0, min(1.0, CONFIDENCE_RAMP_PER_BEAT))  # 0.2 after first observation
         self.phase = 0.0
@@ -276,35 +358,35 @@ class HeartbeatPredictor:
 
         Accumulates observations and calculates initial IBI estimate from
         median of intervals. Transitions to locked mode after INIT_OBSERVATIONS.
+        Only the latest INIT_OBSERVATIONS are kept, so if none of their
+        intervals are in range the window slides on instead of growing.
 
         Args:
             timestamp_s: Observation timestamp (seconds)
         """
+        # Record only the new interval; both windows slide together
+        self._init_intervals.append((timestamp_s - self.init_observations[-1]) * 1000.0)
         self.init_observations.append(timestamp_s)
 
-        # Calculate intervals between consecutive observations
-        intervals = []
-        for i in range(1, len(self.init_observations)):
-            interval_ms = (self.init_observations[i] - self.init_observations[i-1]) * 1000.0
-            # Validate interval is within reasonable bounds
-            if IBI_MIN_MS <= interval_ms <= IBI_MAX_MS:
-                intervals.append(interval_ms)
-
         # Update confidence (ramp by 0.2 per observation)
         # Clamp to [0.0, 1.0] range for defensive programming
         self.confidence = max(0.0, min(1.0, len(self.init_observations) * CONFIDENCE_RAMP_PER_BEAT))
 
+        # Intervals within reasonable bounds (only needed once the window is full)
+        intervals = []
+        if len(self.init_observations) >= INIT_OBSERVATIONS:
+            intervals = [interval_ms for interval_ms in self._init_intervals
+                         if IBI_MIN_MS <= interval_ms <= IBI_MAX_MS]
+
         # If we have enough observations, establish initial IBI and transition
-        if len(self.init_observations) >= INIT_OBSERVATIONS and len(intervals) > 0:
-            # Use median of intervals as initial IBI estimate
-            intervals.sort()
-            median_idx = len(intervals) // 2
-            self.ibi_estimate_ms = intervals[median_idx]
+        if intervals:
+            # Use median of intervals as initial IBI estimate (upper median when even)
+            self._set_ibi_estimate(median_high(intervals))
 
             # Initialize phase to 0.0 - treat this observation as beat reference point
             self.phase = 0.0
-            # Use system time for beat timing (emission thread uses time.time())
-            self.last_beat_time = time.time()
+            # Use monotonic time for beat timing (emission thread uses time.monotonic())
+            self.last_beat_time = time.monotonic()
 
             # Transition to locked mode with time-based fade-in
             self.mode = self.MODE_LOCKED
@@ -312,11 +394,11 @@ class HeartbeatPredictor:
             self.fadein_start_time = timestamp_s
 
             self.logger.info(f"PPG {self.ppg_id}: Predictor locked - IBI={self.ibi_estimate_ms:.0f}ms, "
-                             f"BPM={60000.0 / self.ibi_estimate_ms:.1f}, fading in over {FADEIN_DURATION_MS/1000.0:.1f}s")
+                             f"BPM={self._bpm:.1f}, fading in over {FADEIN_DURATION_MS/1000.0:.1f}s")
 
         else:
-            self.logger.debug(f"PPG {self.ppg_id}: Init observation {len(self.init_observations)}/{INIT_OBSERVATIONS}, "
-                              f"confidence={self.confidence:.1f}")
+            self.logger.debug("PPG %d: Init observation %d/%d, confidence=%.1f",
+                              self.ppg_id, len(self.init_observations), INIT_OBSERVATIONS, self.confidence)
 
     def _process_observation(self, timestamp_s: float) -> None:
         """Process observation in locked or coasting mode.
@@ -335,40 +417,43 @@ class HeartbeatPredictor:
         # Calculate observed IBI (time since last observation)
         observed_ibi_ms = (timestamp_s - self.last_observation_time) * 1000.0
 
-        # Validate observed IBI - basic range check
-        if observed_ibi_ms < IBI_MIN_MS or observed_ibi_ms > IBI_MAX_MS:
-            self.out_of_range_count += 1
-            self.logger.debug(f"PPG {self.ppg_id}: Observation rejected - "
-                              f"IBI {observed_ibi_ms:.0f}ms out of range [{IBI_MIN_MS}, {IBI_MAX_MS}]")
-            return
-
-        # Outlier rejection - prevent death spiral from missed beats
-        ibi_min_bound = self.ibi_estimate_ms / IBI_OUTLIER_FACTOR
-        ibi_max_bound = self.ibi_estimate_ms * IBI_OUTLIER_FACTOR
-        if observed_ibi_ms < ibi_min_bound or observed_ibi_ms > ibi_max_bound:
-            self.outlier_count += 1
-            self.logger.debug(f"PPG {self.ppg_id}: Observation rejected - "
-                              f"IBI {observed_ibi_ms:.0f}ms is outlier (current {self.ibi_estimate_ms:.0f}ms, "
-                              f"bounds [{ibi_min_bound:.0f}, {ibi_max_bound:.0f}]ms)")
+        # Validate observed IBI against basic range and outlier bounds at once
+        # (cached intersection); classify only when rejecting
+        if not self._ibi_accept_min <= observed_ibi_ms <= self._ibi_accept_max:
+            if observed_ibi_ms < IBI_MIN_MS or observed_ibi_ms > IBI_MAX_MS:
+                self.out_of_range_count += 1
+                self.logger.debug("PPG %d: Observation rejected - IBI %.0fms out of range [%d, %d]",
+                                  self.ppg_id, observed_ibi_ms, IBI_MIN_MS, IBI_MAX_MS)
+            else:
+                # Outlier rejection - prevent death spiral from missed beats
+                self.outlier_count += 1
+                self.logger.debug("PPG %d: Observation rejected - IBI %.0fms is outlier (current %.0fms, "
+                                  "bounds [%.0f, %.0f]ms)",
+                                  self.ppg_id, observed_ibi_ms, self.ibi_estimate_ms,
+                                  self.ibi_estimate_ms / IBI_OUTLIER_FACTOR,
+                                  self.ibi_estimate_ms * IBI_OUTLIER_FACTOR)
             return
 
         # Update IBI estimate with exponential smoothing
         old_ibi = self.ibi_estimate_ms
-        self.ibi_estimate_ms = (1.0 - IBI_BLEND_WEIGHT) * old_ibi + IBI_BLEND_WEIGHT * observed_ibi_ms
+        inv_old_ibi = self._inv_ibi_ms  # Captured before _set_ibi_estimate refreshes it
+        self._set_ibi_estimate((1.0 - IBI_BLEND_WEIGHT) * old_ibi + IBI_BLEND_WEIGHT * observed_ibi_ms)
 
         # Phase correction: prevent drift even when IBI is accurate
         # expected_phase = (observed_time - last_observation_time) / current_ibi
         # phase_error = expected_phase - current_phase
-        expected_phase = observed_ibi_ms / old_ibi  # Where phase should be based on observation
+        expected_phase = observed_ibi_ms * inv_old_ibi  # Where phase should be based on observation
         phase_error = expected_phase - self.phase
         # Clamp phase error to prevent large jumps
-        clamped_phase_error = max(-PHASE_CORRECTION_MAX, min(PHASE_CORRECTION_MAX, phase_error))
+        clamped_phase_error = (-PHASE_CORRECTION_MAX if phase_error < -PHASE_CORRECTION_MAX else
+                               PHASE_CORRECTION_MAX if phase_error > PHASE_CORRECTION_MAX else phase_error)
         self.phase += PHASE_CORRECTION_WEIGHT * clamped_phase_error
 
-        self.logger.debug(f"PPG {self.ppg_id}: Observation processed - "
-                          f"IBI {old_ibi:.0f}→{self.ibi_estimate_ms:.0f}ms, "
-                          f"phase correction {clamped_phase_error:+.3f}" +
-                          (f" (clamped from {phase_error:+.3f})" if abs(phase_error) > PHASE_CORRECTION_MAX else ""))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"PPG {self.ppg_id}: Observation processed - "
+                              f"IBI {old_ibi:.0f}→{self.ibi_estimate_ms:.0f}ms, "
+                              f"phase correction {clamped_phase_error:+.3f}" +
+                              (f" (clamped from {phase_error:+.3f})" if abs(phase_error) > PHASE_CORRECTION_MAX else ""))
 
         # Update confidence and mode
         if self.mode == self.MODE_COASTING:
@@ -379,6 +464,8 @@ class HeartbeatPredictor:
             self.logger.info(f"PPG {self.ppg_id}: Coasting → Locked, fading in from confidence={self.confidence:.2f}")
         elif self.fadein_start_time is None:
             # Maintain full confidence in locked mode (only if not already fading in)
+            if self.confidence <= CONFIDENCE_EMISSION_MIN:
+                self._wake.set()
             self.confidence = 1.0
 
     def _update_fadein(self, timestamp_s: float) -> None:
@@ -401,8 +488,7 @@ class HeartbeatPredictor:
             self.logger.warning(f"PPG {self.ppg_id}: Negative elapsed time in fade-in: {elapsed_ms:.0f}ms, "
                                 f"clearing fade-in state")
             self.fadein_start_time = None
-            if hasattr(self, '_fadein_start_confidence'):
-                delattr(self, '_fadein_start_confidence')
+            self._fadein_start_confidence = None
             return
 
         # Calculate target confidence based on elapsed time
@@ -412,53 +498,42 @@ class HeartbeatPredictor:
         # When recovering from coasting, we want to ramp from current confidence to 1.0
         # When starting fresh (initialization), we ramp from 0.0 to 1.0
         # Store the starting confidence when fade-in begins
-        if not hasattr(self, '_fadein_start_confidence'):
+        if self._fadein_start_confidence is None:
             self._fadein_start_confidence = self.confidence
 
         target_confidence = self._fadein_start_confidence + (1.0 - self._fadein_start_confidence) * fadein_progress
         # Clamp confidence to [0.0, 1.0] range
-        self.confidence = max(0.0, min(1.0, target_confidence))
+        previous_confidence = self.confidence
+        self.confidence = (0.0 if target_confidence < 0.0 else
+                           1.0 if target_confidence > 1.0 else target_confidence)
+
+        # Beats become emittable once confidence leaves zero (e.g. first fade-in tick)
+        if previous_confidence <= CONFIDENCE_EMISSION_MIN < self.confidence:
+            self._wake.set()
 
         # Complete fade-in when we reach full confidence
         if self.confidence >= 1.0:
             self.confidence = 1.0
             self.fadein_start_time = None
-            if hasattr(self, '_fadein_start_confidence'):
-                delattr(self, '_fadein_start_confidence')
-            self.logger.debug(f"PPG {self.ppg_id}: Fade-in complete, confidence=1.0")
-
-    def _update_coasting_decay(self, time_delta_ms: float) -> None:
-        """Update confidence decay during coasting mode.
+            self._fadein_start_confidence = None
+            self.logger.debug("PPG %d: Fade-in complete, confidence=1.0", self.ppg_id)
 
-        Decays confidence linearly over COASTING_DURATION_MS (10 seconds).
-        Transitions to stopped mode when confidence reaches 0.
+    def _enter_stopped(self) -> None:
+        """Transition coasting → stopped once confidence has decayed to 0.
 
-        Args:
-            time_delta_ms: Elapsed time since last update (milliseconds)
+        Clears the rhythm model so the next observation starts a fresh
+        initialization. Called from update() with state_lock held.
         """
-        # Guard against negative time deltas (ESP32 reboot causing backward time jump)
-        if time_delta_ms < 0:
-            self.logger.warning(f"PPG {self.ppg_id}: Negative time delta in coasting decay: {time_delta_ms:.0f}ms, ignoring")
-            return
-
-        decay_rate = 1.0 / COASTING_DURATION_MS  # Per millisecond
-        decay_amount = decay_rate * time_delta_ms
-
-        # Clamp confidence to [0.0, 1.0] range
-        self.confidence = max(0.0, min(1.0, self.confidence - decay_amount))
-
-        if self.confidence <= 0.0:
-            # Transition to stopped mode
-            self._print_rejection_metrics(reset=True)
-            self.mode = self.MODE_STOPPED
-            self.ibi_estimate_ms = None
-            self.phase = 0.0
-            self.init_observations = []
-            self.fadein_start_time = None
-            if hasattr(self, '_fadein_start_confidence'):
-                delattr(self, '_fadein_start_confidence')
+        self._print_rejection_metrics(reset=True)
+        self.mode = self.MODE_STOPPED
+        self._set_ibi_estimate(None)
+        self.phase = 0.0
+        self.init_observations.clear()
+        self._init_intervals.clear()
+        self.fadein_start_time = None
+        self._fadein_start_confidence = None
 
-            self.logger.info(f"PPG {self.ppg_id}: Coasting → Stopped (confidence depleted)")
+        self.logger.info(f"PPG {self.ppg_id}: Coasting → Stopped (confidence depleted)")
 
     def enter_coasting(self) -> None:
         """Manually enter coasting mode (thread-safe).
@@ -475,8 +550,7 @@ class HeartbeatPredictor:
                 self.mode = self.MODE_COASTING
                 # Clear any active fade-in
                 self.fadein_start_time = None
-                if hasattr(self, '_fadein_start_confidence'):
-                    delattr(self, '_fadein_start_confidence')
+                self._fadein_start_confidence = None
                 self.logger.info(f"PPG {self.ppg_id}: Predictor Locked → Coasting")
                 self._print_rejection_metrics(reset=True)
             elif self.mode == self.MODE_INITIALIZATION and self.ibi_estimate_ms is not None:
@@ -485,8 +559,7 @@ class HeartbeatPredictor:
                 self.mode = self.MODE_COASTING
                 # Clear any active fade-in
                 self.fadein_start_time = None
-                if hasattr(self, '_fadein_start_confidence'):
-                    delattr(self, '_fadein_start_confidence')
+                self._fadein_start_confidence = None
                 self.logger.info(f"PPG {self.ppg_id}: Predictor Initialization → Coasting (partial confidence)")
                 self._print_rejection_metrics(reset=True)
 
@@ -566,6 +639,9 @@ class HeartbeatPredictor:
             self.running = False
             thread_to_join = self.emission_thread
 
+        # Wake an idle emission thread so it sees running=False immediately
+        self._wake.set()
+
         if thread_to_join:
             thread_to_join.join(timeout=2.0)
             if thread_to_join.is_alive():
@@ -578,7 +654,9 @@ class HeartbeatPredictor:
 
         Continuously calculates next beat time based on current IBI estimate,
         sleeps until lead_time before beat, then sends OSC message. Reads
-        phase/IBI/confidence with thread-safe locks.
+        phase/IBI/confidence with thread-safe locks. While no beat can be
+        emitted (no IBI or zero confidence), blocks on self._wake instead of
+        polling; fade-in, observations and stop() set it.
 
         Thread exits when self.running becomes False.
         """
@@ -588,30 +666,35 @@ class HeartbeatPredictor:
                 if not self.running:
                     break
 
+            # Clear before reading state so a wake-up set after the read is not lost
+            self._wake.clear()
+
             # Read state and calculate next beat time atomically
             with self.state_lock:
                 confidence = self.confidence
                 ibi_ms = self.ibi_estimate_ms
+                bpm = self._bpm
                 last_beat = self.last_beat_time
 
-                # If no IBI estimate or no confidence, sleep briefly and retry
-                # IMPORTANT: Sleep OUTSIDE the lock to avoid blocking main thread
+                # If no IBI estimate or no confidence, wait for a state change
+                # IMPORTANT: Wait OUTSIDE the lock to avoid blocking main thread
                 if confidence <= CONFIDENCE_EMISSION_MIN or ibi_ms is None:
                     should_wait = True
-                    wait_duration = 0.05  # 50ms
                 else:
                     should_wait = False
                     # Calculate next beat time with current state (prevents TOCTOU race)
-                    now = time.time()
+                    # Monotonic clock: wall-clock (NTP) jumps can't skew beat intervals
+                    now = time.monotonic()
+                    ibi_s = ibi_ms * 0.001
                     if last_beat is None:
                         # First beat - start from current time
-                        next_beat_time = now + (ibi_ms / 1000.0)
+                        next_beat_time = now + ibi_s
                     else:
-                        next_beat_time = last_beat + (ibi_ms / 1000.0)
+                        next_beat_time = last_beat + ibi_s
                         # If next beat is in the past (recovery from stopped/coasting),
                         # reset to current time to avoid burst of historical beats
                         if next_beat_time < now:
-                            next_beat_time = now + (ibi_ms / 1000.0)
+                            next_beat_time = now + ibi_s
 
                     # Update last_beat_time NOW (before releasing lock)
                     # This ensures timing calculations stay consistent
@@ -619,48 +702,64 @@ class HeartbeatPredictor:
 
                     # Calculate BPM and intensity from captured state
                     # These values must match the IBI used for timing calculation
-                    beat_bpm = 60000.0 / ibi_ms
+                    beat_bpm = bpm
                     beat_intensity = confidence
 
                     # Calculate sleep duration
                     sleep_until = next_beat_time - self.lead_time_s
-                    wait_duration = sleep_until - time.time()
+                    wait_duration = sleep_until - now
 
-            # Sleep outside lock (doesn't block main thread)
-            if should_wait or wait_duration > 0:
-                time.sleep(max(wait_duration, 0))
-                if should_wait:
-                    continue
+            # Wait outside lock (doesn't block main thread)
+            if should_wait:
+                self._wake.wait(timeout=EMISSION_IDLE_WAIT_S)
+                continue
+            if wait_duration > 0:
+                time.sleep(wait_duration)
 
             # Send beat message with values that match the timing calculation
-            # We still check current confidence to handle mode transitions during sleep
-            with self.state_lock:
-                if self.confidence > CONFIDENCE_EMISSION_MIN and self.ibi_estimate_ms is not None:
-                    self._send_beat(next_beat_time, beat_bpm, beat_intensity)
+            # We still check current confidence to handle mode transitions during sleep.
+            # Single attribute reads are atomic under the GIL, so the re-check needs
+            # no lock, and the send/log I/O no longer holds up update().
+            if self.confidence > CONFIDENCE_EMISSION_MIN and self.ibi_estimate_ms is not None:
+                self._send_beat(next_beat_time, beat_bpm, beat_intensity)
 
     def _send_beat(self, beat_timestamp: float, bpm: float, intensity: float) -> None:
         """Send beat OSC message.
 
         Args:
-            beat_timestamp: Unix timestamp (seconds) when beat will occur
+            beat_timestamp: time.monotonic() seconds when beat will occur
             bpm: Beats per minute to emit (calculated from captured IBI)
             intensity: Confidence/intensity to emit (captured confidence)
 
         Side effects:
             - Sends OSC message to beats_client
-            - Prints to console
+            - Logs each beat at DEBUG and a summary every BEAT_LOG_EVERY beats at INFO
 
-        Note: Must be called with self.state_lock held.
+        Note: Does not need self.state_lock; uses only its arguments and
+        beats_client, which is fixed once start() has run.
         """
+        # Lead time until the beat; also converts the beat to Unix time, which
+        # receivers expect on the wire
+        lead_time_s = beat_timestamp - time.monotonic()
+
         # Format message: [timestamp_ms, bpm, intensity]
-        timestamp_ms = int(beat_timestamp * 1000.0)
+        timestamp_ms = int((time.time() + lead_time_s) * 1000.0)
         msg_data = [timestamp_ms, bpm, intensity]
 
         # Send OSC message
-        self.beats_client.send_message(f"/beat/{self.ppg_id}", msg_data)
-
-        # Calculate lead time for logging
-        lead_time_ms = (beat_timestamp - time.time()) * 1000.0
-
-        self.logger.info(f"PPG {self.ppg_id}: BEAT emitted - BPM={bpm:.1f}, intensity={intensity:.2f}, "
-                         f"lead_time={lead_time_ms:.1f}ms")
+        self.beats_client.send_message(self._beat_address, msg_data)
+
+        self.logger.debug("PPG %d: BEAT emitted - BPM=%.1f, intensity=%.2f, lead_time=%.1fms",
+                          self.ppg_id, bpm, intensity, lead_time_s * 1000.0)
+
+        # Roll beats up into one INFO line instead of logging each one
+        self._beats_since_log += 1
+        self._bpm_sum += bpm
+        self._intensity_sum += intensity
+        if self._beats_since_log >= BEAT_LOG_EVERY:
+            count = self._beats_since_log
+            self.logger.info(f"PPG {self.ppg_id}: {count} beats emitted - mean BPM={self._bpm_sum / count:.1f}, "
+                             f"mean intensity={self._intensity_sum / count:.2f}")
+            self._beats_since_log = 0
+            self._bpm_sum = 0.0
+            self._intensity_sum = 0.0
@@ -160,11 +160,19 @@ class PPGSensor:
         detector (ThresholdDetector): Threshold crossing detector
         predictor (HeartbeatPredictor): Phase-based beat predictor
         last_detector_state (str): Previous detector state for transition detection
+        beat_address (str): OSC address for this sensor's beats (/beat/N)
+        acquire_address (str): OSC address for this sensor's acquire events (/acquire/N)
+        release_address (str): OSC address for this sensor's release events (/release/N)
     """
 
     def __init__(self, ppg_id, beats_port, verbose=False):
         self.ppg_id = ppg_id
 
+        # Output addresses are fixed per sensor, so build them once
+        self.beat_address = f"/beat/{ppg_id}"
+        self.acquire_address = f"/acquire/{ppg_id}"
+        self.release_address = f"/release/{ppg_id}"
+
         # Threshold detector (signal quality and crossing detection)
         self.detector = ThresholdDetector(ppg_id, verbose=verbose)
 
@@ -295,7 +303,7 @@ class SensorProcessor:
     Attributes:
         input_port (int): UDP port for PPG input (default: 8000)
         beats_port (int): UDP port for beat broadcast output (default: 8001)
-        sensors (dict): 8 PPGSensor instances indexed 0-7
+        sensors (tuple): 8 PPGSensor instances indexed by ppg_id 0-7
         stats (MessageStatistics): Message counters
     """
 
@@ -309,7 +317,8 @@ class SensorProcessor:
 
         # Create 8 PPGSensor instances (0-3: real sensors, 4-7: virtual channels)
         # Pass beats_port so each predictor can emit beats autonomously
-        self.sensors = {i: PPGSensor(i, beats_port=beats_port, verbose=verbose) for i in range(8)}
+        # Tuple indexed by ppg_id (validate_message only passes ids 0-7)
+        self.sensors = tuple(PPGSensor(i, beats_port=beats_port, verbose=verbose) for i in range(8))
 
         # Statistics
         self.stats = osc.MessageStatistics()
@@ -404,10 +413,11 @@ class SensorProcessor:
 
         # Process each sample through the sensor's state machine
         # Each sample arrives 20ms apart (50Hz = 1 sample per 20ms)
+        sensor = self.sensors[ppg_id]
         for i, sample in enumerate(samples):
             # Calculate individual timestamp for each sample in the bundle
             sample_timestamp_ms = timestamp_ms + (i * 20)
-            event = self.sensors[ppg_id].add_sample(sample, sample_timestamp_ms)
+            event = sensor.add_sample(sample, sample_timestamp_ms)
 
             # Handle rhythm events (acquire/release)
             # Note: Beat events are now emitted autonomously by predictor threads
@@ -453,7 +463,7 @@ class SensorProcessor:
         # Send timestamp as integer milliseconds to avoid float32 precision issues with large Unix timestamps
         timestamp_ms = int(timestamp * 1000)
         msg_data = [timestamp_ms, float(bpm), float(intensity)]
-        self.beats_client.send_message(f"/beat/{ppg_id}", msg_data)
+        self.beats_client.send_message(self.sensors[ppg_id].beat_address, msg_data)
 
         logger.info(f"BEAT: PPG {ppg_id}, BPM: {bpm:.1f}, Timestamp: {timestamp:.3f}s")
 
@@ -486,7 +496,7 @@ class SensorProcessor:
 
         timestamp_ms = int(timestamp * 1000)
         msg_data = [timestamp_ms, float(bpm)]
-        self.beats_client.send_message(f"/acquire/{ppg_id}", msg_data)
+        self.beats_client.send_message(self.sensors[ppg_id].acquire_address, msg_data)
 
         logger.info(f"ACQUIRE: PPG {ppg_id}, BPM: {bpm:.1f}, Timestamp: {timestamp:.3f}s")
 
@@ -517,7 +527,7 @@ class SensorProcessor:
 
         timestamp_ms = int(timestamp * 1000)
         msg_data = [timestamp_ms]
-        self.beats_client.send_message(f"/release/{ppg_id}", msg_data)
+        self.beats_client.send_message(self.sensors[ppg_id].release_address, msg_data)
 
         logger.info(f"RELEASE: PPG {ppg_id}, Timestamp: {timestamp:.3f}s")
 
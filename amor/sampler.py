@@ -502,9 +502,9 @@ class SamplerController:
             recording_source = self.recording_source
             recorder = self.recorder
 
-        # Parse PPG ID from address
-        is_valid, ppg_id, error_msg = osc.validate_ppg_address(address)
-        if not is_valid:
+        # Parse PPG ID from address (None if invalid)
+        ppg_id = osc.PPG_ADDRESSES.get(address)
+        if ppg_id is None:
             return
 
         # Only record from the source we're listening to
@@ -586,22 +586,24 @@ class Sequencer:
         """
         logger.info("Broadcasting full state to all components...")
 
-        # Send bank state to audio
-        for ppg_id in range(4):
-            bank_name = self.bank_map[ppg_id]
-            self.control_client.send_message("/load_bank", [ppg_id, bank_name])
-
-        # Send routing to audio
-        for ppg_id in range(4):
-            sample_id = self.sample_map[ppg_id]
-            self.control_client.send_message(f"/route/{ppg_id}", sample_id)
-
-        # Send all LED updates
-        for row in range(4):
-            self.update_ppg_row_leds(row)
+        # Coalesce the burst into a few bundles instead of ~70 datagrams
+        with self.control_client.batch():
+            # Send bank state to audio
+            for ppg_id in range(4):
+                bank_name = self.bank_map[ppg_id]
+                self.control_client.send_message("/load_bank", [ppg_id, bank_name])
+
+            # Send routing to audio
+            for ppg_id in range(4):
+                sample_id = self.sample_map[ppg_id]
+                self.control_client.send_message(f"/route/{ppg_id}", sample_id)
+
+            # Send all LED updates
+            for row in range(4):
+                self.update_ppg_row_leds(row)
 
-        for loop_id in range(32):
-            self.update_loop_led(loop_id)
+            for loop_id in range(32):
+                self.update_loop_led(loop_id)
 
         self.stats.increment('reconnections')
         logger.info("  Full state broadcast complete")
@@ -649,21 +651,22 @@ class Sequencer:
         """
         logger.info("Sending initial LED state to Launchpad Bridge...")
 
-        # PPG rows (0-3): column 0 selected (pulse), others unselected (flash)
-        for row in range(4):
-            for col in range(8):
-                if col == 0:
-                    color = LED_COLOR_SELECTED
-                    mode = LED_MODE_PULSE  # Selected button pulses brighter on beat
-                else:
-                    color = LED_COLOR_UNSELECTED
-                    mode = LED_MODE_FLASH  # Unselected buttons flash on beat
-                self.control_client.send_message(f"/led/{row}/{col}", [color, mode])
-
-        # Loop rows (4-7): all off, static (no beat pulse)
-        for row in range(4, 8):
-            for col in range(8):
-                self.control_client.send_message(f"/led/{row}/{col}", [LED_COLOR_LOOP_OFF, LED_MODE_STATIC])
+        with self.control_client.batch():
+            # PPG rows (0-3): column 0 selected (pulse), others unselected (flash)
+            for row in range(4):
+                for col in range(8):
+                    if col == 0:
+                        color = LED_COLOR_SELECTED
+                        mode = LED_MODE_PULSE  # Selected button pulses brighter on beat
+                    else:
+                        color = LED_COLOR_UNSELECTED
+                        mode = LED_MODE_FLASH  # Unselected buttons flash on beat
+                    self.control_client.send_message(f"/led/{row}/{col}", [color, mode])
+
+            # Loop rows (4-7): all off, static (no beat pulse)
+            for row in range(4, 8):
+                for col in range(8):
+                    self.control_client.send_message(f"/led/{row}/{col}", [LED_COLOR_LOOP_OFF, LED_MODE_STATIC])
 
         logger.info("  Initial LED state sent")
 
@@ -697,18 +700,19 @@ class Sequencer:
         """
         self.active_control_mode = control_id
 
-        # Light up control button LED
-        self.control_client.send_message(f"/led/control/{control_id}", [LED_COLOR_CONTROL_ACTIVE, LED_MODE_STATIC])
+        with self.control_client.batch():
+            # Light up control button LED
+            self.control_client.send_message(f"/led/control/{control_id}", [LED_COLOR_CONTROL_ACTIVE, LED_MODE_STATIC])
 
-        # Update grid LEDs based on mode
-        if control_id == 0:
-            self.update_lighting_mode_leds()
-        elif control_id == 1:
-            self.update_bpm_mode_leds()
-        elif control_id == 2:
-            self.update_bank_mode_leds()
-        elif control_id == 3:
-            self.update_effects_mode_leds()
+            # Update grid LEDs based on mode
+            if control_id == 0:
+                self.update_lighting_mode_leds()
+            elif control_id == 1:
+                self.update_bpm_mode_leds()
+            elif control_id == 2:
+                self.update_bank_mode_leds()
+            elif control_id == 3:
+                self.update_effects_mode_leds()
 
     def exit_control_mode(self, restore_leds: bool = True):
         """Exit current control mode.
@@ -723,18 +727,19 @@ class Sequencer:
         if self.active_control_mode is None:
             return
 
-        # Turn off control button LED
-        self.control_client.send_message(f"/led/control/{self.active_control_mode}", [LED_COLOR_CONTROL_INACTIVE, LED_MODE_STATIC])
+        with self.control_client.batch():
+            # Turn off control button LED
+            self.control_client.send_message(f"/led/control/{self.active_control_mode}", [LED_COLOR_CONTROL_INACTIVE, LED_MODE_STATIC])
 
-        self.active_control_mode = None
+            self.active_control_mode = None
 
-        # Restore normal grid LEDs (unless switching modes)
-        if restore_leds:
-            for row in range(4):
-                self.update_ppg_row_leds(row)
+            # Restore normal grid LEDs (unless switching modes)
+            if restore_leds:
+                for row in range(4):
+                    self.update_ppg_row_leds(row)
 
-            for loop_id in range(32):
-                self.update_loop_led(loop_id)
+                for loop_id in range(32):
+                    self.update_loop_led(loop_id)
 
     def update_lighting_mode_leds(self):
         """Update grid LEDs for lighting program selection mode (Control 0).
@@ -235,9 +235,7 @@ class PPGViewer:
         self.current_bpm = None
         self.beat_lock = threading.Lock()
 
-        # Address pattern regex for validation
-        # Address patterns now handled by osc.validate_ppg_address()
-        # Address patterns now handled by osc.validate_beat_address()
+        # Address patterns handled by osc.PPG_ADDRESSES / osc.BEAT_ADDRESSES
 
         # Matplotlib objects (initialized in run())
         self.fig = None
@@ -282,9 +280,9 @@ class PPGViewer:
         if len(args) < 2:
             return
 
-        # Validate address pattern and extract PPG ID
-        is_valid, message_ppg_id, _ = osc.validate_ppg_address(address)
-        if not is_valid:
+        # Validate address pattern and extract PPG ID (None if invalid)
+        message_ppg_id = osc.PPG_ADDRESSES.get(address)
+        if message_ppg_id is None:
             return
 
         # Filter by PPG ID
@@ -354,9 +352,9 @@ class PPGViewer:
         if len(args) < 2:
             return
 
-        # Validate address pattern and extract PPG ID
-        is_valid, message_ppg_id, _ = osc.validate_beat_address(address)
-        if not is_valid:
+        # Validate address pattern and extract PPG ID (None if invalid)
+        message_ppg_id = osc.BEAT_ADDRESSES.get(address)
+        if message_ppg_id is None:
             return
 
         # Filter by PPG ID